@@ -1,12 +1,30 @@
 
+import asyncio
+import functools
+import hashlib
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-import sys
-import pandas as pd
+import csv
+import io
+import itertools
+import json
+import orjson
+import logging
+import re
+import tempfile
+import time
+from langchain_core.language_models import BaseChatModel
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import BaseTool
-from pydantic import Field, BaseModel
-from typing import Type, List, Any, Dict
-from langchain_deepseek import ChatDeepSeek
+from pydantic import Field, BaseModel, PrivateAttr, model_validator
+from typing import Type, List, Any, Dict, Optional, Iterable, Sequence, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
 
 class CloudMailClient:
     def __init__(self, cloud_mail_url, cloud_mail_email, cloud_mail_password):
@@ -17,12 +35,23 @@ class CloudMailClient:
         self.password = cloud_mail_password
         self.token = None
 
+        # Reuse one keep-alive connection pool for every call to the mail server
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def login(self):
         login_url = f"{self.base_url}/api/login"
         payload = {"email": self.email, "password": self.password}
-        response = requests.post(login_url, json=payload)
+        response = self.session.post(login_url, json=payload)
         response.raise_for_status()
-        self.token = response.json()["data"]["token"]
+        self.token = orjson.loads(response.content)["data"]["token"]
+        self.session.headers.update({"Authorization": self.token})
 
     def get_headers(self):
         if not self.token:
@@ -31,15 +60,28 @@ class CloudMailClient:
 
     def get_user_info(self):
         user_info_url = f"{self.base_url}/api/my/loginUserInfo"
-        response = requests.get(user_info_url, headers=self.get_headers())
+        response = self.session.get(user_info_url, headers=self.get_headers())
         response.raise_for_status()
-        return response.json()["data"]
+        return orjson.loads(response.content)["data"]
 
     def list_emails(self, account_id):
         list_url = f"{self.base_url}/api/email/list?accountId={account_id}&type=0&size=10&timeSort=0"
-        response = requests.get(list_url, headers=self.get_headers())
+        response = self.session.get(list_url, headers=self.get_headers())
         response.raise_for_status()
-        return response.json()["data"]["list"]
+        return orjson.loads(response.content)["data"]["list"]
+
+    def iter_emails(self, account_id, page_size=20):
+        """Yield inbox messages newest-first, fetching one page at a time as they are consumed."""
+        page = 1
+        while True:
+            list_url = f"{self.base_url}/api/email/list?accountId={account_id}&type=0&page={page}&size={page_size}&timeSort=0"
+            response = self.session.get(list_url, headers=self.get_headers())
+            response.raise_for_status()
+            messages = orjson.loads(response.content)["data"]["list"]
+            yield from messages
+            if len(messages) < page_size:
+                return
+            page += 1
 
     def send_email(self, account_id, name, recipient, subject, body):
         payload = {
@@ -52,9 +94,309 @@ class CloudMailClient:
             "attachments": []
         }
         send_url = f"{self.base_url}/api/email/send"
-        response = requests.post(send_url, headers=self.get_headers(), json=payload)
+        response = self.session.post(send_url, headers=self.get_headers(), json=payload)
+        response.raise_for_status()
+
+    def close(self):
+        """Close underlying session."""
+        self.session.close()
+
+class AsyncCloudMailClient:
+    """Async counterpart of CloudMailClient backed by a shared httpx.AsyncClient."""
+    def __init__(self, cloud_mail_url, cloud_mail_email, cloud_mail_password, **kwargs):
+        self.base_url = cloud_mail_url
+        if not self.base_url.startswith("http"):
+            self.base_url = "https://" + self.base_url
+        self.email = cloud_mail_email
+        self.password = cloud_mail_password
+        self.token = None
+        self.client = httpx.AsyncClient(base_url=self.base_url, **kwargs)
+        self._login_lock = asyncio.Lock()
+
+    async def login(self):
+        response = await self.client.post("/api/login", json={"email": self.email, "password": self.password})
+        response.raise_for_status()
+        self.token = orjson.loads(response.content)["data"]["token"]
+        self.client.headers["Authorization"] = self.token
+
+    async def _ensure_login(self):
+        # Concurrent callers share a single login request
+        async with self._login_lock:
+            if not self.token:
+                await self.login()
+
+    async def get_user_info(self):
+        await self._ensure_login()
+        response = await self.client.get("/api/my/loginUserInfo")
+        response.raise_for_status()
+        return orjson.loads(response.content)["data"]
+
+    async def iter_emails(self, account_id, page_size=20):
+        """Yield inbox messages newest-first, fetching one page at a time as they are consumed."""
+        await self._ensure_login()
+        page = 1
+        while True:
+            params = {"accountId": account_id, "type": 0, "page": page, "size": page_size, "timeSort": 0}
+            response = await self.client.get("/api/email/list", params=params)
+            response.raise_for_status()
+            messages = orjson.loads(response.content)["data"]["list"]
+            for message in messages:
+                yield message
+            if len(messages) < page_size:
+                return
+            page += 1
+
+    async def send_email(self, account_id, name, recipient, subject, body):
+        await self._ensure_login()
+        payload = {
+            "accountId": account_id,
+            "name": name,
+            "receiveEmail": [recipient],
+            "subject": subject,
+            "content": body,
+            "text": body,
+            "attachments": []
+        }
+        response = await self.client.post("/api/email/send", json=payload)
         response.raise_for_status()
 
+    async def close(self):
+        """Close the underlying HTTP session."""
+        await self.client.aclose()
+
+# How long a CirtusAI login and the resolved agent permissions are reused
+# across tool invocations before logging in again.
+AUTH_CACHE_TTL = 300
+
+@dataclass
+class _AuthCache:
+    """CirtusAI session state shared by the cloud-mail tools."""
+    username: Optional[str] = None
+    token: Optional[str] = None
+    refresh_token: Optional[str] = None
+    permissions: Dict[str, List[str]] = field(default_factory=dict)
+    expires_at: float = 0.0
+
+    def valid(self, username: str) -> bool:
+        return self.token is not None and self.username == username and time.monotonic() < self.expires_at
+
+    def store(self, username: str, token: str, refresh_token: Optional[str] = None):
+        self.username = username
+        self.token = token
+        self.refresh_token = refresh_token
+        self.permissions = {}
+        self.expires_at = time.monotonic() + AUTH_CACHE_TTL
+
+    def invalidate(self):
+        self.token = None
+        self.permissions = {}
+        self.expires_at = 0.0
+
+_auth_cache = _AuthCache()
+
+def _authenticate(client, username: str, password: str):
+    """Log in to CirtusAI unless a still-valid token is cached for this user."""
+    if _auth_cache.valid(username):
+        client.set_token(_auth_cache.token)
+        return
+    logger.info("--- Authenticating with CirtusAI ---")
+    # login() sets the token on the client itself
+    token_response = client.auth.login(username, password)
+    _auth_cache.store(username, token_response.access_token, token_response.refresh_token)
+    logger.info("Authentication successful.")
+
+def _reauthenticate(client, username: str, password: str):
+    """Replace a rejected token, preferring the refresh token over a full login."""
+    refresh_token = _auth_cache.refresh_token
+    _auth_cache.invalidate()
+    if refresh_token:
+        try:
+            data = client.auth.refresh(refresh_token)
+            client.set_token(data["access_token"])
+            _auth_cache.store(username, data["access_token"], data.get("refresh_token", refresh_token))
+            return
+        except Exception as e:
+            logger.warning("Token refresh failed (%s); logging in again", e)
+    _authenticate(client, username, password)
+
+def _get_permissions(client, agent_id: str, username: str, password: str) -> List[str]:
+    """
+    Return the permissions granted to a child agent, cached for the lifetime of the login.
+
+    Raises LookupError with a user-facing message when the agent cannot be found.
+    """
+    if agent_id in _auth_cache.permissions:
+        return _auth_cache.permissions[agent_id]
+
+    try:
+        permissions = _fetch_child_permissions(client, agent_id)
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code != 401:
+            raise
+        _reauthenticate(client, username, password)
+        permissions = _fetch_child_permissions(client, agent_id)
+
+    _auth_cache.permissions[agent_id] = permissions
+    return permissions
+
+def _child_route_missing(status_code: int) -> bool:
+    """
+    Whether an error from GET /agents/children/{id} means the backend doesn't serve that route.
+
+    A backend that only exposes DELETE there answers 405 rather than 404, so any client error
+    other than an auth failure or rate limit is treated as "no per-child route".
+    """
+    return 400 <= status_code < 500 and status_code not in (401, 403, 429)
+
+def _fetch_child_permissions(client, agent_id: str) -> List[str]:
+    try:
+        child_agent = client.agents.get_child(agent_id)
+    except requests.HTTPError as e:
+        if e.response is None or not _child_route_missing(e.response.status_code):
+            raise
+        # Backends without the per-child route only expose children on the master agent
+        return _find_child_permissions(client.agents.list_agents(), agent_id)
+    return child_agent.get("permissions_granted", [])
+
+def _find_child_permissions(master_agent: Dict[str, Any], agent_id: str) -> List[str]:
+    if not master_agent:
+        raise LookupError("Error: Could not find master agent.")
+
+    child_agent = next((agent for agent in master_agent.get('state', {}).get('linked_children', []) if agent.get('child_agent_id') == agent_id), None)
+    if not child_agent:
+        raise LookupError(f"Error: Child agent '{agent_id}' not found.")
+
+    return child_agent.get("permissions_granted", [])
+
+async def _aauthenticate(client, username: str, password: str):
+    """Async variant of _authenticate for an AsyncCirtusAIClient."""
+    if _auth_cache.valid(username):
+        await client.set_token(_auth_cache.token)
+        return
+    logger.info("--- Authenticating with CirtusAI ---")
+    # login() sets the token on the client itself
+    token_response = await client.auth.login(username, password)
+    _auth_cache.store(username, token_response.access_token, token_response.refresh_token)
+    logger.info("Authentication successful.")
+
+async def _areauthenticate(client, username: str, password: str):
+    """Async variant of _reauthenticate for an AsyncCirtusAIClient."""
+    refresh_token = _auth_cache.refresh_token
+    _auth_cache.invalidate()
+    if refresh_token:
+        try:
+            data = await client.auth.refresh(refresh_token)
+            await client.set_token(data["access_token"])
+            _auth_cache.store(username, data["access_token"], data.get("refresh_token", refresh_token))
+            return
+        except Exception as e:
+            logger.warning("Token refresh failed (%s); logging in again", e)
+    await _aauthenticate(client, username, password)
+
+async def _aget_permissions(client, agent_id: str, username: str, password: str) -> List[str]:
+    """Async variant of _get_permissions for an AsyncCirtusAIClient."""
+    if agent_id in _auth_cache.permissions:
+        return _auth_cache.permissions[agent_id]
+
+    try:
+        permissions = await _afetch_child_permissions(client, agent_id)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code != 401:
+            raise
+        await _areauthenticate(client, username, password)
+        permissions = await _afetch_child_permissions(client, agent_id)
+
+    _auth_cache.permissions[agent_id] = permissions
+    return permissions
+
+async def _afetch_child_permissions(client, agent_id: str) -> List[str]:
+    try:
+        child_agent = await client.agents.get_child(agent_id)
+    except httpx.HTTPStatusError as e:
+        if not _child_route_missing(e.response.status_code):
+            raise
+        return _find_child_permissions(await client.agents.list_agents(), agent_id)
+    return child_agent.get("permissions_granted", [])
+
+def _permission_error(result: Any) -> Optional[str]:
+    """Turn a failed permission lookup from asyncio.gather into the tool's error message."""
+    if isinstance(result, LookupError):
+        return str(result)
+    if isinstance(result, Exception):
+        return f"Error fetching agent permissions: {result}"
+    return None
+
+async def _run_sync(func, *args):
+    """Run a blocking tool implementation in the default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+# Upper bound on the email text sent to the LLM for a one-sentence summary.
+MAX_EMAIL_CHARS = 4000
+
+# Start of quoted history in a reply: Gmail/Apple "On <date>, <name> [<addr>] wrote:" (the
+# address is often wrapped onto its own line) or an Outlook "Original Message" / From:+Sent: block
+_REPLY_HEADER_RE = re.compile(
+    r"^[ \t]*On [^\n]+?(?:\s*<\s*[^>\n]+>)?\s*wrote:[ \t]*$"
+    r"|^[ \t]*-+ ?Original Message ?-+[ \t]*$"
+    r"|^[ \t]*From: [^\n]+\n[ \t]*Sent: ",
+    re.MULTILINE | re.IGNORECASE
+)
+_QUOTED_LINE_RE = re.compile(r"^\s*>.*$", re.MULTILINE)
+# Only real markup counts as HTML; <https://...> links and <bob@example.com> addresses in
+# plain-text mail must survive cleaning
+_HTML_TAG_RE = re.compile(
+    r"</?(?:html|head|body|div|p|br|span|a|font|b|i|u|strong|em|table|tbody|tr|td|th|ul|ol|li"
+    r"|blockquote|img|h[1-6]|hr|pre|style|script|meta|center)\b[^>]*>",
+    re.IGNORECASE
+)
+# Quoted history that mail clients wrap in its own element. Outlook instead puts the
+# history after a From:/Sent: header block, which _REPLY_HEADER_RE cuts off.
+_QUOTE_SELECTORS = "blockquote, .gmail_quote, .yahoo_quoted"
+_BLOCK_TAGS = ["p", "div", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "pre", "table"]
+_WHITESPACE_RE = re.compile(r"\s+")
+
+SUMMARY_SYSTEM_PROMPT = "Please summarize the following email content in one sentence."
+
+# Compiled once and shared by every summarization call
+_SUMMARY_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SUMMARY_SYSTEM_PROMPT),
+    ("human", "{body}"),
+])
+
+def _html_to_text(html: str) -> str:
+    """Extract the text of an HTML email without its quoted history, keeping line structure."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    for node in soup.select(_QUOTE_SELECTORS):
+        node.decompose()
+    for node in soup.find_all(["style", "script", "head"]):
+        node.decompose()
+    # Line breaks come only from <br> and block elements, so inline nodes such as a
+    # linked sender name stay on the same line as the rest of a reply header
+    for node in soup.find_all("br"):
+        node.replace_with("\n")
+    for node in soup.find_all(_BLOCK_TAGS):
+        node.insert_after("\n")
+    return soup.get_text()
+
+def _clean_email(text: str) -> str:
+    """Strip HTML, quoted replies and extra whitespace, then cap the length of an email body."""
+    if not text:
+        return ""
+    if _HTML_TAG_RE.search(text):
+        text = _html_to_text(text)
+    reply_header = _REPLY_HEADER_RE.search(text)
+    if reply_header:
+        text = text[:reply_header.start()]
+    text = _QUOTED_LINE_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    return text[:MAX_EMAIL_CHARS]
+
+def _content_key(body: str) -> bytes:
+    """Hash a cleaned email body so identical emails share one summary."""
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).digest()
+
 class SendEmailInput(BaseModel):
     recipient: str = Field(description="The recipient's email address.")
     subject: str = Field(description="The subject of the email.")
@@ -69,41 +411,29 @@ class CloudMailSendEmailTool(BaseTool):
     username: str
     password: str
     cloud_mail_client: CloudMailClient
+    # Optional AsyncCirtusAIClient / AsyncCloudMailClient used by _arun
+    async_client: Any = None
+    async_cloud_mail_client: Optional[AsyncCloudMailClient] = None
 
     def _run(self, recipient: str, subject: str, body: str) -> str:
-        print("--- Authenticating with CirtusAI ---")
-        sys.stdout.flush()
         try:
-            token_response = self.client.auth.login(self.username, self.password)
-            self.client.set_token(token_response.access_token)
-            print("Authentication successful.")
-            sys.stdout.flush()
+            _authenticate(self.client, self.username, self.password)
         except Exception as e:
             return f"Authentication failed: {e}"
 
-        print(f"--- Verifying Permissions for Agent: {self.agent_id} ---")
-        sys.stdout.flush()
+        logger.info("--- Verifying Permissions for Agent: %s ---", self.agent_id)
         try:
-            master_agent = self.client.agents.list_agents()
-            if not master_agent:
-                return "Error: Could not find master agent."
-            
-            child_agent = next((agent for agent in master_agent.get('state', {}).get('linked_children', []) if agent.get('child_agent_id') == self.agent_id), None)
-
-            if not child_agent:
-                return f"Error: Child agent '{self.agent_id}' not found."
-
-            permissions = child_agent.get("permissions_granted", [])
-            print(f"Agent Permissions: {permissions}")
-            sys.stdout.flush()
+            permissions = _get_permissions(self.client, self.agent_id, self.username, self.password)
+            logger.info("Agent Permissions: %s", permissions)
+        except LookupError as e:
+            return str(e)
         except Exception as e:
             return f"Error fetching agent permissions: {e}"
 
         if "send_email" not in permissions:
             return "Permission Denied: This agent is not authorized to send emails."
 
-        print("--- Permission Granted: Sending Email ---")
-        sys.stdout.flush()
+        logger.info("--- Permission Granted: Sending Email ---")
         try:
             user_info = self.cloud_mail_client.get_user_info()
             account_id = user_info["accountId"]
@@ -113,81 +443,395 @@ class CloudMailSendEmailTool(BaseTool):
         except Exception as e:
             return f"Error sending email: {e}"
 
+    async def _arun(self, recipient: str, subject: str, body: str) -> str:
+        if self.async_client is None or self.async_cloud_mail_client is None:
+            return await _run_sync(self._run, recipient, subject, body)
+
+        try:
+            await _aauthenticate(self.async_client, self.username, self.password)
+        except Exception as e:
+            return f"Authentication failed: {e}"
+
+        logger.info("--- Verifying Permissions for Agent: %s ---", self.agent_id)
+        # The sender details do not depend on the permission check, so fetch both at once
+        permissions, user_info = await asyncio.gather(
+            _aget_permissions(self.async_client, self.agent_id, self.username, self.password),
+            self.async_cloud_mail_client.get_user_info(),
+            return_exceptions=True
+        )
+        permission_error = _permission_error(permissions)
+        if permission_error:
+            return permission_error
+        logger.info("Agent Permissions: %s", permissions)
+
+        if "send_email" not in permissions:
+            return "Permission Denied: This agent is not authorized to send emails."
+
+        logger.info("--- Permission Granted: Sending Email ---")
+        if isinstance(user_info, Exception):
+            return f"Error sending email: {user_info}"
+        try:
+            await self.async_cloud_mail_client.send_email(user_info["accountId"], user_info["name"], recipient, subject, body)
+            return "Email sent successfully."
+        except Exception as e:
+            return f"Error sending email: {e}"
+
 class CloudMailReadAndSummarizeEmailTool(BaseTool):
     name: str = "read_and_summarize_emails"
     description: str = "Connects to the Cirtus platform to read and summarize emails."
-    llm: ChatDeepSeek
+    # Any LangChain chat model (e.g. ChatDeepSeek); typed against the base class so
+    # importing this module does not pull in a provider package
+    llm: BaseChatModel
     client: Any
     agent_id: str
     username: str
     password: str
     cloud_mail_client: CloudMailClient
+    max_emails: int = 10
+    max_concurrency: int = 8
+    # Large inboxes can be summarized through an OpenAI-compatible batch endpoint
+    # instead of interactive requests. Results may take up to the provider's
+    # completion window, so this is opt-in and only used once a run reads at least
+    # batch_threshold emails; max_emails must therefore be raised to batch_threshold or more.
+    # batch_client must be an openai.OpenAI client configured for the same provider
+    # as llm, e.g. OpenAI(base_url=..., api_key=...), since the llm's model name is sent.
+    # A job still running after batch_max_wait seconds is cancelled and summarized directly.
+    use_batch_api: bool = False
+    batch_threshold: int = 50
+    batch_client: Any = None
+    batch_poll_interval: float = 30.0
+    batch_max_wait: float = 600.0
+    # Optional AsyncCirtusAIClient / AsyncCloudMailClient used by _arun
+    async_client: Any = None
+    async_cloud_mail_client: Optional[AsyncCloudMailClient] = None
+    # Only emails newer than the last summarized one are read on later runs.
+    # Set cursor_path (e.g. ~/.cirtusai/cursor.json) to keep the cursor across processes.
+    cursor_path: Optional[str] = None
+    _last_seen_ids: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _cursor_loaded: bool = PrivateAttr(default=False)
+
+    @model_validator(mode="after")
+    def _check_batch_client(self):
+        if self.use_batch_api and self.batch_client is None:
+            raise ValueError("use_batch_api requires batch_client, an OpenAI-compatible client for the llm's provider")
+        if self.use_batch_api and self.max_emails < self.batch_threshold:
+            raise ValueError(
+                f"use_batch_api has no effect unless max_emails ({self.max_emails}) "
+                f"is at least batch_threshold ({self.batch_threshold})"
+            )
+        return self
+
+    @staticmethod
+    def _message_id(message: Dict[str, Any]) -> Any:
+        return message.get("emailId", message.get("id"))
+
+    def _last_seen_id(self, account_id: Any) -> Any:
+        if not self._cursor_loaded:
+            self._cursor_loaded = True
+            if self.cursor_path and os.path.exists(os.path.expanduser(self.cursor_path)):
+                with open(os.path.expanduser(self.cursor_path), encoding="utf-8") as f:
+                    self._last_seen_ids.update(json.load(f))
+        return self._last_seen_ids.get(str(account_id))
+
+    def _advance_cursor(self, account_id: Any, message_id: Any):
+        if message_id is None:
+            return
+        self._last_seen_ids[str(account_id)] = message_id
+        if self.cursor_path:
+            path = os.path.expanduser(self.cursor_path)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self._last_seen_ids, f)
+
+    def _unseen(self, account_id: Any, messages: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+        """Stop a newest-first message stream at the last message summarized for this account."""
+        last_seen_id = self._last_seen_id(account_id)
+        if last_seen_id is None:
+            return messages
+        return itertools.takewhile(lambda m: self._message_id(m) != last_seen_id, messages)
+
+    @staticmethod
+    def _prompt_input(message: Dict[str, Any]) -> Dict[str, str]:
+        return {"body": _clean_email(message.get("text", ""))}
+
+    @staticmethod
+    def _summary_row(message: Dict[str, Any], summary: str) -> Dict[str, str]:
+        return {
+            'Sender': message.get("sendEmail", "Unknown Sender"),
+            'Subject': message.get("subject", "No Subject"),
+            'Summary': summary
+        }
+
+    @classmethod
+    def _submission_order(cls, messages: Sequence[Dict[str, Any]]) -> List[Tuple[int, Dict[str, str]]]:
+        """
+        Return (index, prompt_input) pairs in the order they should be sent to the LLM.
+
+        The longest cleaned bodies go first so they do not end up as stragglers after
+        the short ones have drained the pool.
+        """
+        prompt_inputs = [cls._prompt_input(m) for m in messages]
+        return sorted(enumerate(prompt_inputs), key=lambda item: len(item[1]["body"]), reverse=True)
+
+    def _summarize_concurrently(self, messages: Sequence[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Summarize messages on a thread pool, longest first.
+
+        Results are returned in the original message order. Messages whose cleaned
+        body is identical reuse the same LLM call.
+        """
+        chain = _SUMMARY_PROMPT | self.llm
+        futures_by_key = {}
+        futures = [None] * len(messages)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for index, prompt_input in self._submission_order(messages):
+                key = _content_key(prompt_input["body"])
+                if key not in futures_by_key:
+                    futures_by_key[key] = executor.submit(chain.invoke, prompt_input)
+                futures[index] = futures_by_key[key]
+            return [self._summary_row(message, future.result().content) for message, future in zip(messages, futures)]
+
+    async def _asummarize_concurrently(self, messages: Sequence[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Async variant of _summarize_concurrently using ainvoke, bounded by max_concurrency."""
+        chain = _SUMMARY_PROMPT | self.llm
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def summarize(prompt_input):
+            async with semaphore:
+                return (await chain.ainvoke(prompt_input)).content
+
+        order = self._submission_order(messages)
+        tasks_by_key = {}
+        tasks = []
+        for _, prompt_input in order:
+            key = _content_key(prompt_input["body"])
+            if key not in tasks_by_key:
+                tasks_by_key[key] = asyncio.ensure_future(summarize(prompt_input))
+            tasks.append(tasks_by_key[key])
+        texts = await asyncio.gather(*tasks)
+        summaries = [None] * len(order)
+        for (index, _), text in zip(order, texts):
+            summaries[index] = self._summary_row(messages[index], text)
+        return summaries
+
+    def _truncation_note(self) -> str:
+        """
+        Explain that unseen emails beyond max_emails were left out.
+
+        The cursor still moves to the newest message, so those older emails are not
+        picked up by later runs either.
+        """
+        logger.warning("More than %d unseen emails; older ones were not summarized", self.max_emails)
+        return (f"Note: more than {self.max_emails} new emails were found. Only the {self.max_emails} most recent "
+                "were summarized; older unread emails were skipped and will not appear in later summaries.\n")
+
+    @staticmethod
+    def _format_csv(summaries: List[Dict[str, str]]) -> str:
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(["Sender", "Subject", "Summary"])
+        writer.writerows((s["Sender"], s["Subject"], s["Summary"]) for s in summaries)
+        return buf.getvalue()
+
+    def _summarize_with_batch_api(self, bodies: List[str]) -> List[str]:
+        """Submit all email bodies as one provider batch job and return the summaries in order."""
+        # Only unique bodies are sent; duplicates are filled back in at the end
+        keys = [_content_key(body) for body in bodies]
+        unique_bodies = dict(zip(keys, bodies))
+        unique_keys = list(unique_bodies)
+
+        batch_client = self.batch_client
+        model = getattr(self.llm, "model_name", None) or getattr(self.llm, "model", "deepseek-chat")
+
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False, encoding="utf-8") as f:
+            for i, body in enumerate(unique_bodies.values()):
+                f.write(json.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {"model": model, "messages": [
+                        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                        {"role": "user", "content": body}
+                    ]}
+                }) + "\n")
+            input_path = f.name
+        try:
+            with open(input_path, "rb") as f:
+                input_file = batch_client.files.create(file=f, purpose="batch")
+        finally:
+            os.remove(input_path)
+
+        batch = batch_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        deadline = time.monotonic() + self.batch_max_wait
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(self.batch_poll_interval, remaining))
+            batch = batch_client.batches.retrieve(batch.id)
+
+        summaries_by_key = {}
+        if batch.status == "completed":
+            output = batch_client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("error"):
+                    continue
+                body = (record.get("response") or {}).get("body") or {}
+                choices = body.get("choices") or []
+                if choices:
+                    summaries_by_key[unique_keys[int(record["custom_id"])]] = choices[0]["message"]["content"]
+        elif batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch job {batch.id} ended with status '{batch.status}'")
+        else:
+            logger.warning("Batch job %s still '%s' after %ss; cancelling it", batch.id, batch.status, self.batch_max_wait)
+            try:
+                batch_client.batches.cancel(batch.id)
+            except Exception as e:
+                logger.warning("Could not cancel batch job %s: %s", batch.id, e)
+
+        # Records that errored or are missing from the output are summarized interactively
+        failed_keys = [key for key in unique_keys if key not in summaries_by_key]
+        if failed_keys:
+            logger.warning("Batch job %s returned no summary for %d emails; retrying them directly", batch.id, len(failed_keys))
+            chain = _SUMMARY_PROMPT | self.llm
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                results = executor.map(lambda key: chain.invoke({"body": unique_bodies[key]}).content, failed_keys)
+                summaries_by_key.update(zip(failed_keys, results))
+        return [summaries_by_key[key] for key in keys]
 
     def _run(self) -> str:
-        print("--- Authenticating with CirtusAI ---")
-        sys.stdout.flush()
         try:
-            token_response = self.client.auth.login(self.username, self.password)
-            self.client.set_token(token_response.access_token)
-            print("Authentication successful.")
-            sys.stdout.flush()
+            _authenticate(self.client, self.username, self.password)
         except Exception as e:
             return f"Authentication failed: {e}"
 
-        print(f"--- Verifying Permissions for Agent: {self.agent_id} ---")
-        sys.stdout.flush()
+        logger.info("--- Verifying Permissions for Agent: %s ---", self.agent_id)
         try:
-            master_agent = self.client.agents.list_agents()
-            if not master_agent:
-                return "Error: Could not find master agent."
-            
-            child_agent = next((agent for agent in master_agent.get('state', {}).get('linked_children', []) if agent.get('child_agent_id') == self.agent_id), None)
-
-            if not child_agent:
-                return f"Error: Child agent '{self.agent_id}' not found."
-
-            permissions = child_agent.get("permissions_granted", [])
-            print(f"Agent Permissions: {permissions}")
-            sys.stdout.flush()
+            permissions = _get_permissions(self.client, self.agent_id, self.username, self.password)
+            logger.info("Agent Permissions: %s", permissions)
+        except LookupError as e:
+            return str(e)
         except Exception as e:
             return f"Error fetching agent permissions: {e}"
 
         if "read_email" not in permissions:
             return "Permission Denied: This agent is not authorized to read emails."
 
-        print("--- Permission Granted: Reading Inbox ---")
-        sys.stdout.flush()
+        logger.info("--- Permission Granted: Reading Inbox ---")
         try:
             user_info = self.cloud_mail_client.get_user_info()
             account_id = user_info["accountId"]
-            messages = self.cloud_mail_client.list_emails(account_id)
+            inbox = self.cloud_mail_client.iter_emails(account_id, page_size=self.max_emails)
+            newest = next(inbox, None)
+            if newest is None:
+                return "No unseen emails."
+            # At most max_emails messages, so the whole batch can be ordered before submission;
+            # one extra is read to tell whether older unseen messages are being left out
+            messages = list(itertools.islice(
+                self._unseen(account_id, itertools.chain([newest], inbox)),
+                self.max_emails + 1
+            ))
+            truncated = len(messages) > self.max_emails
+            messages = messages[:self.max_emails]
         except Exception as e:
             return f"Error reading inbox: {e}"
 
-        if not messages:
-            return "No unseen emails."
+        if self.use_batch_api and len(messages) >= self.batch_threshold:
+            logger.info("--- Submitting %d summaries to batch endpoint ---", len(messages))
+            try:
+                summary_texts = self._summarize_with_batch_api([self._prompt_input(m)["body"] for m in messages])
+            except Exception as e:
+                return f"Error running batch summarization: {e}"
+            summaries = [self._summary_row(m, text) for m, text in zip(messages, summary_texts)]
+        else:
+            summaries = self._summarize_concurrently(messages)
 
-        print(f"--- Found {len(messages)} messages to summarize ---")
-        sys.stdout.flush()
+        if not summaries:
+            return "No new emails since the last summary."
 
-        summaries = []
-        for message in messages:
-            email_content = message.get("text", "")
-            sender = message.get("sendEmail", "Unknown Sender")
-            subject = message.get("subject", "No Subject")
+        self._advance_cursor(account_id, self._message_id(newest))
+        logger.info("--- Summarized %d messages ---", len(summaries))
 
-            prompt = f"Please summarize the following email content in one sentence: \n\n{email_content}"
-            summary = self.llm.invoke(prompt).content
-            summaries.append({
-                'Sender': sender,
-                'Subject': subject,
-                'Summary': summary
-            })
+        logger.info("--- Formatting Summary ---")
+        return self._format_csv(summaries) + (self._truncation_note() if truncated else "")
 
-        print("--- Formatting Summary ---")
-        sys.stdout.flush()
-        df = pd.DataFrame(summaries)
-        return df.to_csv(index=False)
+    async def _arun(self) -> str:
+        if self.async_client is None or self.async_cloud_mail_client is None:
+            return await _run_sync(self._run)
+
+        try:
+            await _aauthenticate(self.async_client, self.username, self.password)
+        except Exception as e:
+            return f"Authentication failed: {e}"
+
+        logger.info("--- Verifying Permissions for Agent: %s ---", self.agent_id)
+        # The mail account lookup does not depend on the permission check, so fetch both at once
+        permissions, user_info = await asyncio.gather(
+            _aget_permissions(self.async_client, self.agent_id, self.username, self.password),
+            self.async_cloud_mail_client.get_user_info(),
+            return_exceptions=True
+        )
+        permission_error = _permission_error(permissions)
+        if permission_error:
+            return permission_error
+        logger.info("Agent Permissions: %s", permissions)
+
+        if "read_email" not in permissions:
+            return "Permission Denied: This agent is not authorized to read emails."
+
+        logger.info("--- Permission Granted: Reading Inbox ---")
+        if isinstance(user_info, Exception):
+            return f"Error reading inbox: {user_info}"
+        account_id = user_info["accountId"]
+        last_seen_id = self._last_seen_id(account_id)
+        newest = None
+        messages = []
+        inbox = self.async_cloud_mail_client.iter_emails(account_id, page_size=self.max_emails)
+        try:
+            # Same selection as _run: unseen messages, newest first, at most max_emails
+            async for message in inbox:
+                if newest is None:
+                    newest = message
+                if len(messages) > self.max_emails:
+                    break
+                # Without a cursor there is nothing to stop at, even for messages lacking an id
+                if last_seen_id is not None and self._message_id(message) == last_seen_id:
+                    break
+                messages.append(message)
+        except Exception as e:
+            return f"Error reading inbox: {e}"
+        finally:
+            await inbox.aclose()
+        truncated = len(messages) > self.max_emails
+        messages = messages[:self.max_emails]
+
+        if newest is None:
+            return "No unseen emails."
+        if not messages:
+            return "No new emails since the last summary."
+
+        logger.info("--- Found %d messages to summarize ---", len(messages))
+
+        if self.use_batch_api and len(messages) >= self.batch_threshold:
+            logger.info("--- Submitting summaries to batch endpoint ---")
+            try:
+                summary_texts = await _run_sync(self._summarize_with_batch_api, [self._prompt_input(m)["body"] for m in messages])
+            except Exception as e:
+                return f"Error running batch summarization: {e}"
+            summaries = [self._summary_row(m, text) for m, text in zip(messages, summary_texts)]
+        else:
+            summaries = await self._asummarize_concurrently(messages)
+
+        self._advance_cursor(account_id, self._message_id(newest))
+        logger.info("--- Formatting Summary ---")
+        return self._format_csv(summaries) + (self._truncation_note() if truncated else "")
 
 class CloudMailGetAccountInfoTool(BaseTool):
     name: str = "get_email_account_information"
@@ -196,16 +840,25 @@ class CloudMailGetAccountInfoTool(BaseTool):
     username: str
     password: str
     cloud_mail_client: CloudMailClient
+    # Optional AsyncCirtusAIClient / AsyncCloudMailClient used by _arun
+    async_client: Any = None
+    async_cloud_mail_client: Optional[AsyncCloudMailClient] = None
 
     def _run(self) -> dict:
-        print("--- Authenticating with CirtusAI ---")
-        sys.stdout.flush()
         try:
-            token_response = self.client.auth.login(self.username, self.password)
-            self.client.set_token(token_response.access_token)
-            print("Authentication successful.")
-            sys.stdout.flush()
+            _authenticate(self.client, self.username, self.password)
         except Exception as e:
             return f"Authentication failed: {e}"
-        
+
         return self.cloud_mail_client.get_user_info()
+
+    async def _arun(self) -> dict:
+        if self.async_client is None or self.async_cloud_mail_client is None:
+            return await _run_sync(self._run)
+
+        try:
+            await _aauthenticate(self.async_client, self.username, self.password)
+        except Exception as e:
+            return f"Authentication failed: {e}"
+
+        return await self.async_cloud_mail_client.get_user_info()
@@ -18,8 +18,7 @@ CIRTUS_PASSWORD = os.getenv("CIRTUS_PASSWORD")
 # --- CirtusAI Client Initialization ---
 try:
     client = CirtusAIClient(base_url=CIRTUS_API_URL)
-    token_data = client.auth.login(username=CIRTUS_USERNAME, password=CIRTUS_PASSWORD)
-    client.set_token(token_data.access_token)
+    client.auth.login(username=CIRTUS_USERNAME, password=CIRTUS_PASSWORD)
 except Exception as e:
     sys.stderr.write(f"Error initializing CirtusAIClient or logging in: {e}\n")
     sys.exit(1)
@@ -6,6 +6,9 @@ from dotenv import load_dotenv
 from cirtusai.client import CirtusAIClient
 from cloud_mail_tool import CloudMailClient, CloudMailSendEmailTool, CloudMailReadAndSummarizeEmailTool, CloudMailGetAccountInfoTool
 import sys
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file
 try:
@@ -35,12 +38,19 @@ except Exception as e:
 
 def main():
     """Initializes and runs the email summarizer agent."""
+    # Flush on newline once here instead of after every print
+    sys.stdout.reconfigure(line_buffering=True)
+    # Only this agent's progress messages are shown; third-party loggers (e.g. httpx
+    # request lines from the LLM client) stay at the default WARNING level
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stdout)
+    for name in ("cloud_mail_tool", __name__):
+        logging.getLogger(name).setLevel(logging.INFO)
+
     if not all([CIRTUS_USERNAME, CIRTUS_PASSWORD, CIRTUS_AGENT_ID, DEEPSEEK_API_KEY, CLOUD_MAIL_URL, CLOUD_MAIL_EMAIL, CLOUD_MAIL_PASSWORD]):
         sys.stderr.write("Error: Missing required environment variables in .env file.\n")
         sys.exit(1)
 
-    print("--- Initializing Email Summarizer Agent ---")
-    sys.stdout.flush()
+    logger.info("--- Initializing Email Summarizer Agent ---")
 
     try:
         llm = ChatDeepSeek(model="deepseek-chat", api_key=DEEPSEEK_API_KEY, temperature=0)
@@ -92,30 +102,23 @@ def main():
 
     executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
 
-    print("--- Starting Interactive Agent ---")
-    sys.stdout.flush()
+    logger.info("--- Starting Interactive Agent ---")
     print("Type 'exit' or 'quit' to end the session.")
-    sys.stdout.flush()
 
     while True:
         user_input = input("\nYour command: ")
         if user_input.lower() in ["exit", "quit"]:
             print("Exiting agent session.")
-            sys.stdout.flush()
             break
         
         try:
             result = executor.invoke({"input": user_input})
             print("\nAgent Response:")
-            sys.stdout.flush()
             print(result['output'])
-            sys.stdout.flush()
         except Exception as e:
             print(f"An error occurred during agent execution: {e}")
-            sys.stdout.flush()
 
     print("Script finished.")
-    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
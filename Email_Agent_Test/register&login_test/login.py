@@ -4,5 +4,4 @@ token = client.auth.login(
     username="tommywang",
     password="123"
 )
-print(f"Access Token: {token.access_token}")
-client.set_token(token.access_token)
\ No newline at end of file
+print(f"Access Token: {token.access_token}")
\ No newline at end of file
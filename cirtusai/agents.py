@@ -61,6 +61,13 @@ class AgentsClient:
         resp.raise_for_status()
         return resp.json()
 
+    def get_child(self, child_id: str) -> Dict[str, Any]:
+        """Retrieve a single child agent linked to the master agent."""
+        url = f"{self.base_url}/agents/children/{child_id}"
+        resp = self.session.get(url)
+        resp.raise_for_status()
+        return resp.json()
+
     def update_child_permissions(self, child_id: str, permissions: Dict[str, Any]) -> Dict[str, Any]:
         """Update permissions for a specific child agent."""
         url = f"{self.base_url}/agents/children/{child_id}/permissions"
@@ -36,6 +36,12 @@ class AsyncAgentsClient:
         response.raise_for_status()
         return response.json()
 
+    async def get_child(self, child_id: str) -> Dict[str, Any]:
+        """Retrieve a single child agent linked to the master agent asynchronously."""
+        response = await self.client.get(f"/agents/children/{child_id}")
+        response.raise_for_status()
+        return response.json()
+
     async def update_child_permissions(self, child_id: str, permissions: Dict[str, Any]) -> Dict[str, Any]:
         response = await self.client.put(f"/agents/children/{child_id}/permissions", json={"permissions": permissions})
         response.raise_for_status()
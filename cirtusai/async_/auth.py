@@ -1,4 +1,6 @@
 import httpx
+from .. import _json
+from ..auth import _2fa_error_code
 from typing import Dict, Any, Union, Optional
 from ..schemas import (
     Token, 
@@ -10,9 +12,23 @@ from ..schemas import (
     TwoFactorDisableRequest
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 class TwoFactorAuthenticationError(Exception):
-    """Raised when 2FA verification fails."""
-    pass
+    """
+    Raised when 2FA verification fails.
+
+    ``code`` classifies the failure so callers can branch without parsing the
+    message: INVALID_TOTP, TIME_SKEW, EXPIRED_TEMP_TOKEN or UNKNOWN.
+    """
+    INVALID_TOTP = "INVALID_TOTP"
+    TIME_SKEW = "TIME_SKEW"
+    EXPIRED_TEMP_TOKEN = "EXPIRED_TEMP_TOKEN"
+    UNKNOWN = "UNKNOWN"
+
+    def __init__(self, message: str, code: str = UNKNOWN):
+        super().__init__(message)
+        self.code = code
 
 class AsyncAuthClient:
     """
@@ -29,6 +45,11 @@ class AsyncAuthClient:
         self.client = client
         self.base_url = base_url.rstrip("/")
 
+    def _store_token(self, token: Token) -> Token:
+        """Authenticate subsequent client requests with a freshly issued token."""
+        self.client.headers["Authorization"] = f"Bearer {token.access_token}"
+        return token
+
     async def register(self, username: str, email: str, password: str, 
                       preferred_2fa_method: str = "totp") -> TwoFactorSetupResponse:
         """
@@ -50,14 +71,17 @@ class AsyncAuthClient:
             password=password,
             preferred_2fa_method=preferred_2fa_method
         )
-        resp = await self.client.post(url, json=user_data.model_dump())
+        resp = await self.client.post(url, content=_json.dumps(user_data.model_dump()), headers=_JSON_HEADERS)
         resp.raise_for_status()
-        return TwoFactorSetupResponse(**resp.json())
+        return TwoFactorSetupResponse(**_json.loads(resp.content))
 
     async def login(self, username: str, password: str) -> Union[Token, TwoFactorRequiredResponse]:
         """
         Perform initial login - returns either immediate token or 2FA requirement.
         
+        When no 2FA is required the access token is also set on the client,
+        so subsequent requests are authenticated without calling set_token.
+        
         Args:
             username: Username or email
             password: User's password
@@ -70,18 +94,20 @@ class AsyncAuthClient:
         resp = await self.client.post(url, data=data)
         resp.raise_for_status()
         
-        response_data = resp.json()
+        response_data = _json.loads(resp.content)
         
         # Check if 2FA is required
         if response_data.get("requires_2fa"):
             return TwoFactorRequiredResponse(**response_data)
         else:
-            return Token(**response_data)
+            return self._store_token(Token(**response_data))
 
     async def verify_2fa(self, temporary_token: str, totp_code: str) -> Token:
         """
         Complete 2FA verification and receive final access token.
         
+        On success the access token is also set on the client.
+        
         Args:
             temporary_token: Temporary token from login response
             totp_code: 6-digit TOTP code from authenticator app
@@ -97,12 +123,13 @@ class AsyncAuthClient:
             temporary_token=temporary_token,
             totp_code=totp_code
         )
-        resp = await self.client.post(url, json=verify_request.model_dump())
+        resp = await self.client.post(url, content=_json.dumps(verify_request.model_dump()), headers=_JSON_HEADERS)
         # Raise custom exception on any error status code
         if resp.status_code >= 400:
-            error_detail = resp.json().get("detail", "2FA verification failed")
-            raise TwoFactorAuthenticationError(error_detail)
-        return Token(**resp.json())
+            payload = _json.loads(resp.content)
+            error_detail = payload.get("detail", "2FA verification failed")
+            raise TwoFactorAuthenticationError(error_detail, _2fa_error_code(payload))
+        return self._store_token(Token(**_json.loads(resp.content)))
 
     async def login_with_2fa(self, username: str, password: str, totp_code: str) -> Token:
         """
@@ -137,21 +164,21 @@ class AsyncAuthClient:
         url = f"{self.base_url}/auth/2fa/status"
         resp = await self.client.get(url)
         resp.raise_for_status()
-        return TwoFactorStatusResponse(**resp.json())
+        return TwoFactorStatusResponse(**_json.loads(resp.content))
 
     async def setup_2fa(self) -> TwoFactorSetupResponse:
         """Set up 2FA for existing user (alternative to registration auto-setup)."""
         url = f"{self.base_url}/auth/2fa/setup"
         resp = await self.client.get(url)
         resp.raise_for_status()
-        return TwoFactorSetupResponse(**resp.json())
+        return TwoFactorSetupResponse(**_json.loads(resp.content))
 
     async def confirm_2fa(self, totp_code: str) -> Dict[str, str]:
         """Confirm and enable 2FA setup with verification code."""
         url = f"{self.base_url}/auth/2fa/confirm"
-        resp = await self.client.post(url, json={"totp_code": totp_code})
+        resp = await self.client.post(url, content=_json.dumps({"totp_code": totp_code}), headers=_JSON_HEADERS)
         resp.raise_for_status()
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def disable_2fa(self, totp_code: str, password: str) -> Dict[str, str]:
         """Disable 2FA for the current user."""
@@ -160,9 +187,9 @@ class AsyncAuthClient:
             totp_code=totp_code,
             password=password
         )
-        resp = await self.client.post(url, json=disable_request.model_dump())
+        resp = await self.client.post(url, content=_json.dumps(disable_request.model_dump()), headers=_JSON_HEADERS)
         resp.raise_for_status()
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def get_qr_code(self) -> bytes:
         """Get QR code image as PNG bytes."""
@@ -176,7 +203,7 @@ class AsyncAuthClient:
         url = f"{self.base_url}/auth/2fa/request-sms"
         resp = await self.client.post(url)
         resp.raise_for_status()
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def debug_2fa(self) -> Dict[str, Any]:
         """
@@ -187,11 +214,11 @@ class AsyncAuthClient:
         url = f"{self.base_url}/auth/debug-2fa"
         resp = await self.client.get(url)
         resp.raise_for_status()
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def refresh(self, refresh_token: str) -> Dict[str, Any]:
         """Refresh the access token using a valid refresh token."""
         url = f"{self.base_url}/auth/refresh"
-        resp = await self.client.post(url, json={"refresh_token": refresh_token})
+        resp = await self.client.post(url, content=_json.dumps({"refresh_token": refresh_token}), headers=_JSON_HEADERS)
         resp.raise_for_status()
-        return resp.json()
+        return _json.loads(resp.content)
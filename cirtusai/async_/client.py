@@ -15,6 +15,11 @@ class AsyncCirtusAIClient:
         if token:
             headers["Authorization"] = f"Bearer {token}"
         
+        # HTTP/2 lets concurrent sub-client calls multiplex over one connection;
+        # explicit kwargs still override these defaults.
+        kwargs.setdefault("http2", True)
+        kwargs.setdefault("limits", httpx.Limits(max_connections=100, max_keepalive_connections=20))
+        kwargs.setdefault("timeout", httpx.Timeout(30.0, connect=5.0))
         self.client = httpx.AsyncClient(base_url=self.base_url, headers=headers, **kwargs)
         self.auth = AsyncAuthClient(self.client, self.base_url)
         self.agents = AsyncAgentsClient(self.client, self.base_url)
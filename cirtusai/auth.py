@@ -1,5 +1,7 @@
 import requests
-from typing import Dict, Any, Union, Optional
+import time
+from typing import Callable, Dict, Any, Tuple, Union, Optional
+from . import _json
 from .schemas import (
     Token, 
     TwoFactorRequiredResponse, 
@@ -10,9 +12,37 @@ from .schemas import (
     TwoFactorDisableRequest
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 class TwoFactorAuthenticationError(Exception):
-    """Raised when 2FA verification fails."""
-    pass
+    """
+    Raised when 2FA verification fails.
+
+    ``code`` classifies the failure so callers can branch without parsing the
+    message: INVALID_TOTP, TIME_SKEW, EXPIRED_TEMP_TOKEN or UNKNOWN.
+    """
+    INVALID_TOTP = "INVALID_TOTP"
+    TIME_SKEW = "TIME_SKEW"
+    EXPIRED_TEMP_TOKEN = "EXPIRED_TEMP_TOKEN"
+    UNKNOWN = "UNKNOWN"
+
+    def __init__(self, message: str, code: str = UNKNOWN):
+        super().__init__(message)
+        self.code = code
+
+
+def _2fa_error_code(payload: Dict[str, Any]) -> str:
+    """Pick the error code for a failed 2FA response, preferring one sent by the server."""
+    if payload.get("code"):
+        return payload["code"]
+    detail = str(payload.get("detail", "")).lower()
+    if "temporary token" in detail:
+        return TwoFactorAuthenticationError.EXPIRED_TEMP_TOKEN
+    if "time_step" in detail or "time skew" in detail:
+        return TwoFactorAuthenticationError.TIME_SKEW
+    if "invalid" in detail and "code" in detail:
+        return TwoFactorAuthenticationError.INVALID_TOTP
+    return TwoFactorAuthenticationError.UNKNOWN
 
 class AuthClient:
     """
@@ -25,9 +55,34 @@ class AuthClient:
     - SMS 2FA support (framework ready)
     - Debug and troubleshooting methods
     """
+    # Lifetime of cached read-only 2FA responses; matches the 30 second TOTP time step
+    CACHE_TTL = 30.0
+
     def __init__(self, session: requests.Session, base_url: str):
         self.session = session
         self.base_url = base_url
+        self._cache: Dict[Tuple[Optional[str], str], Tuple[Any, float]] = {}
+
+    def _cached(self, endpoint: str, fetch: Callable[[], Any]) -> Any:
+        """Return a cached response for endpoint under the current token, fetching it if stale."""
+        key = (self.session.headers.get("Authorization"), endpoint)
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and hit[1] > now:
+            return hit[0]
+        value = fetch()
+        self._cache[key] = (value, now + self.CACHE_TTL)
+        return value
+
+    def _store_token(self, token: Token) -> Token:
+        """Authenticate subsequent session requests with a freshly issued token."""
+        self.session.headers["Authorization"] = f"Bearer {token.access_token}"
+        self.invalidate_cache()
+        return token
+
+    def invalidate_cache(self) -> None:
+        """Drop cached 2FA status/debug responses (called after token changes and 2FA updates)."""
+        self._cache.clear()
 
     def register(self, username: str, email: str, password: str, 
                 preferred_2fa_method: str = "totp") -> TwoFactorSetupResponse:
@@ -50,7 +105,7 @@ class AuthClient:
             password=password,
             preferred_2fa_method=preferred_2fa_method
         )
-        resp = self.session.post(url, json=user_data.model_dump())
+        resp = self.session.post(url, data=_json.dumps(user_data.model_dump()), headers=_JSON_HEADERS)
         resp.raise_for_status()
         return TwoFactorSetupResponse(**resp.json())
 
@@ -58,6 +113,9 @@ class AuthClient:
         """
         Perform initial login - returns either immediate token or 2FA requirement.
         
+        When no 2FA is required the access token is also set on the session,
+        so subsequent requests are authenticated without calling set_token.
+        
         Args:
             username: Username or email
             password: User's password
@@ -76,12 +134,14 @@ class AuthClient:
         if response_data.get("requires_2fa"):
             return TwoFactorRequiredResponse(**response_data)
         else:
-            return Token(**response_data)
+            return self._store_token(Token(**response_data))
 
     def verify_2fa(self, temporary_token: str, totp_code: str) -> Token:
         """
         Complete 2FA verification and receive final access token.
         
+        On success the access token is also set on the session.
+        
         Args:
             temporary_token: Temporary token from login response
             totp_code: 6-digit TOTP code from authenticator app
@@ -97,14 +157,16 @@ class AuthClient:
             temporary_token=temporary_token,
             totp_code=totp_code
         )
-        resp = self.session.post(url, json=verify_request.model_dump())
+        resp = self.session.post(url, data=_json.dumps(verify_request.model_dump()), headers=_JSON_HEADERS)
+        self.invalidate_cache()
         
         if resp.status_code == 401:
-            error_detail = resp.json().get("detail", "2FA verification failed")
-            raise TwoFactorAuthenticationError(error_detail)
+            payload = resp.json()
+            error_detail = payload.get("detail", "2FA verification failed")
+            raise TwoFactorAuthenticationError(error_detail, _2fa_error_code(payload))
         
         resp.raise_for_status()
-        return Token(**resp.json())
+        return self._store_token(Token(**resp.json()))
 
     def login_with_2fa(self, username: str, password: str, totp_code: str) -> Token:
         """
@@ -134,8 +196,15 @@ class AuthClient:
         
         raise TwoFactorAuthenticationError("Unexpected login response")
 
-    def get_2fa_status(self) -> TwoFactorStatusResponse:
-        """Get current 2FA status for authenticated user."""
+    def get_2fa_status(self, use_cache: bool = False) -> TwoFactorStatusResponse:
+        """
+        Get current 2FA status for authenticated user.
+
+        Args:
+            use_cache: Reuse a response fetched with the same token within CACHE_TTL seconds
+        """
+        if use_cache:
+            return self._cached("2fa/status", self.get_2fa_status)
         url = f"{self.base_url}/auth/2fa/status"
         resp = self.session.get(url)
         resp.raise_for_status()
@@ -145,13 +214,15 @@ class AuthClient:
         """Set up 2FA for existing user (alternative to registration auto-setup)."""
         url = f"{self.base_url}/auth/2fa/setup"
         resp = self.session.get(url)
+        self.invalidate_cache()
         resp.raise_for_status()
         return TwoFactorSetupResponse(**resp.json())
 
     def confirm_2fa(self, totp_code: str) -> Dict[str, str]:
         """Confirm and enable 2FA setup with verification code."""
         url = f"{self.base_url}/auth/2fa/confirm"
-        resp = self.session.post(url, json={"totp_code": totp_code})
+        resp = self.session.post(url, data=_json.dumps({"totp_code": totp_code}), headers=_JSON_HEADERS)
+        self.invalidate_cache()
         resp.raise_for_status()
         return resp.json()
 
@@ -162,7 +233,8 @@ class AuthClient:
             totp_code=totp_code,
             password=password
         )
-        resp = self.session.post(url, json=disable_request.model_dump())
+        resp = self.session.post(url, data=_json.dumps(disable_request.model_dump()), headers=_JSON_HEADERS)
+        self.invalidate_cache()
         resp.raise_for_status()
         return resp.json()
 
@@ -180,12 +252,17 @@ class AuthClient:
         resp.raise_for_status()
         return resp.json()
 
-    def debug_2fa(self) -> Dict[str, Any]:
+    def debug_2fa(self, use_cache: bool = False) -> Dict[str, Any]:
         """
         Debug TOTP setup and time sync issues (authenticated users only).
         
         Returns detailed information about current valid TOTP codes.
+
+        Args:
+            use_cache: Reuse a response fetched with the same token within CACHE_TTL seconds
         """
+        if use_cache:
+            return self._cached("debug-2fa", self.debug_2fa)
         url = f"{self.base_url}/auth/debug-2fa"
         resp = self.session.get(url)
         resp.raise_for_status()
@@ -194,6 +271,6 @@ class AuthClient:
     def refresh(self, refresh_token: str) -> Dict[str, Any]:
         """Refresh access token and return raw response dict."""
         url = f"{self.base_url}/auth/refresh"
-        resp = self.session.post(url, json={"refresh_token": refresh_token})
+        resp = self.session.post(url, data=_json.dumps({"refresh_token": refresh_token}), headers=_JSON_HEADERS)
         resp.raise_for_status()
         return resp.json()
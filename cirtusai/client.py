@@ -1,5 +1,4 @@
 import requests
-import functools
 from .auth import AuthClient
 from .agents import AgentsClient
 from .wallets import WalletsClient
@@ -13,20 +12,31 @@ from .marketplace import MarketplaceClient
 from .swap import SwapClient
 from .nfts import NftsClient
 from .child_assets import ChildAssetsClient
+
+
+class _DefaultsSession(requests.Session):
+    """requests.Session that applies default request options (e.g. timeout) to every call."""
+    def __init__(self, request_defaults: dict = None):
+        super().__init__()
+        self.request_defaults = dict(request_defaults or {})
+
+    def request(self, method, url, **kwargs):
+        if self.request_defaults:
+            kwargs = {**self.request_defaults, **kwargs}
+        return super().request(method, url, **kwargs)
+
+
 class CirtusAIClient:
     """
     Synchronous client for CirtusAI: wraps sub-clients for auth, agents, wallets, and identity.
     """
     def __init__(self, base_url: str, token: str = None, **kwargs):
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
+        # Allow passing custom requests options like timeout
+        self.session = _DefaultsSession(kwargs)
         if token:
             self.session.headers.update({"Authorization": f"Bearer {token}"})
 
-        # Allow passing custom requests options like timeout
-        if kwargs:
-            self.session.request = functools.partial(self.session.request, **kwargs)
-
         self.auth = AuthClient(self.session, self.base_url)
         self.agents = AgentsClient(self.session, self.base_url)
         self.wallets = WalletsClient(self.session, self.base_url)
@@ -47,6 +57,7 @@ class CirtusAIClient:
     def set_token(self, token: str):
         """Update the Authorization header with a new token."""
         self.session.headers.update({"Authorization": f"Bearer {token}"})
+        self.auth.invalidate_cache()
 
     @property
     def token(self) -> str:
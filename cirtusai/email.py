@@ -56,8 +56,7 @@ class EmailSummarizerTool(BaseTool):
         print("--- Authenticating with CirtusAI ---")
         sys.stdout.flush()
         try:
-            token_response = self.client.auth.login(self.username, self.password)
-            self.client.set_token(token_response.access_token)
+            self.client.auth.login(self.username, self.password)
             print("Authentication successful.")
             sys.stdout.flush()
         except Exception as e:
@@ -141,8 +140,7 @@ class SendEmailTool(BaseTool):
         print("--- Authenticating with CirtusAI ---")
         sys.stdout.flush()
         try:
-            token_response = self.client.auth.login(self.username, self.password)
-            self.client.set_token(token_response.access_token)
+            self.client.auth.login(self.username, self.password)
             print("Authentication successful.")
             sys.stdout.flush()
         except Exception as e:
@@ -192,8 +190,7 @@ class GetEmailAccountTool(BaseTool):
     def _run(self) -> str:
         """Execute the tool."""
         try:
-            token_response = self.client.auth.login(self.username, self.password)
-            self.client.set_token(token_response.access_token)
+            self.client.auth.login(self.username, self.password)
         except Exception as e:
             return f"Authentication failed: {e}"
 
@@ -222,8 +219,7 @@ class UpdateEmailAccountTool(BaseTool):
     def _run(self, account_id: str, provider: str, email_address: str, config: Dict[str, Any]) -> str:
         """Execute the tool."""
         try:
-            token_response = self.client.auth.login(self.username, self.password)
-            self.client.set_token(token_response.access_token)
+            self.client.auth.login(self.username, self.password)
         except Exception as e:
             return f"Authentication failed: {e}"
 
@@ -1,3 +1,5 @@
+import base64
+from functools import cached_property
 from pydantic import BaseModel, Field, EmailStr, StrictBool
 from typing import List, Dict, Any, Optional
 
@@ -43,10 +45,16 @@ class TwoFactorSetupResponse(BaseModel):
     qr_code_image: str
     backup_codes: List[str]
 
+    @cached_property
+    def qr_code_png(self) -> bytes:
+        """QR code image as PNG bytes, decoded from qr_code_image once on first access."""
+        return base64.b64decode(self.qr_code_image)
+
 class Token(BaseModel):
     """Standard JWT token response."""
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
 
 class TwoFactorRequiredResponse(BaseModel):
     """Response when 2FA verification is required."""
@@ -12,6 +12,7 @@ Examples included:
 4. 2FA management (status, disable, debug)
 5. Error handling
 6. Async client usage
+7. Async error handling (concurrent probes)
 
 Requirements:
 - CirtusAI backend running on http://localhost:8000
@@ -19,19 +20,78 @@ Requirements:
 """
 
 import asyncio
-import base64
-import io
-from PIL import Image
+import atexit
+import functools
+import hmac
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Optional
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cirtusai import CirtusAIClient
 from cirtusai.async_ import AsyncCirtusAIClient
+from cirtusai.async_.auth import TwoFactorAuthenticationError as AsyncTwoFactorAuthenticationError
 from cirtusai.auth import TwoFactorAuthenticationError
+from cirtusai.schemas import TwoFactorRequiredResponse
+
+_BANNER60 = "=" * 60
+_BANNER20 = "=" * 20
+
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_client():
+    """Return one CirtusAIClient, and its keep-alive connection pool, shared by all examples."""
+    client = CirtusAIClient(base_url="http://localhost:8000")
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.2)
+    )
+    client.session.mount("http://", adapter)
+    client.session.mount("https://", adapter)
+    atexit.register(client.close)
+    return client
+
+
+_ASYNC_CLIENT: Optional[AsyncCirtusAIClient] = None
+_ASYNC_CLIENT_LOCK: Optional[asyncio.Lock] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_event_loop():
+    """Return the one event loop all async examples run on, so the shared async client stays usable."""
+    loop = asyncio.new_event_loop()
+    atexit.register(loop.close)
+    return loop
+
+
+async def _get_async_client():
+    """Return one AsyncCirtusAIClient, created lazily and shared by all async examples."""
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOCK
+    if _ASYNC_CLIENT_LOCK is None:
+        _ASYNC_CLIENT_LOCK = asyncio.Lock()
+    async with _ASYNC_CLIENT_LOCK:
+        if _ASYNC_CLIENT is None:
+            _ASYNC_CLIENT = AsyncCirtusAIClient(
+                base_url="http://localhost:8000",
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+            atexit.register(_close_async_client)
+    return _ASYNC_CLIENT
+
+
+def _close_async_client():
+    """Close the shared async client on the loop it was created on."""
+    _get_event_loop().run_until_complete(_ASYNC_CLIENT.close())
 
 
 def example_registration_and_2fa_setup():
     """Example 1: Register new user with automatic 2FA setup"""
     print("=== Example 1: User Registration with 2FA Setup ===")
     
-    client = CirtusAIClient(base_url="http://localhost:8000")
+    client = _get_shared_client()
     
     try:
         # Register new user - 2FA is automatically set up
@@ -42,47 +102,59 @@ def example_registration_and_2fa_setup():
             preferred_2fa_method="totp"
         )
         
-        print("✅ User registered successfully!")
-        print(f"📱 TOTP Secret: {setup_info.secret}")
-        print(f"🔗 QR URI: {setup_info.qr_code_uri}")
-        print(f"🔢 Backup Codes: {setup_info.backup_codes}")
+        sys.stdout.write("\n".join([
+            "✅ User registered successfully!",
+            f"📱 TOTP Secret: {setup_info.secret}",
+            f"🔗 QR URI: {setup_info.qr_code_uri}",
+            f"🔢 Backup Codes: {setup_info.backup_codes}",
+        ]) + "\n")
         
         # Save QR code as image file
-        qr_image_data = base64.b64decode(setup_info.qr_code_image)
-        with open("qr_code.png", "wb") as f:
-            f.write(qr_image_data)
+        qr_image_data = setup_info.qr_code_png
+        Path("qr_code.png").write_bytes(qr_image_data)
         print("💾 QR code saved as qr_code.png")
         
         # Display QR code if PIL is available
         try:
+            from PIL import Image
+            import io
             img = Image.open(io.BytesIO(qr_image_data))
             img.show()
             print("📱 QR code displayed - scan with your authenticator app")
         except ImportError:
             print("📱 Install PIL to display QR code: pip install Pillow")
         
-        print("\n🎯 Next steps:")
-        print("1. Scan the QR code with your authenticator app")
-        print("2. Use the TOTP codes for login")
+        sys.stdout.write("\n".join([
+            "\n🎯 Next steps:",
+            "1. Scan the QR code with your authenticator app",
+            "2. Use the TOTP codes for login",
+        ]) + "\n")
         
     except Exception as e:
         print(f"❌ Registration failed: {e}")
-    finally:
-        client.close()
+
+
+def _matching_time_step(debug_info, totp_code):
+    """Return the first time step whose debug code matches totp_code; each comparison is constant-time."""
+    candidate = totp_code.encode()
+    for step, code in debug_info["valid_codes"].items():
+        if hmac.compare_digest(str(code).encode(), candidate):
+            return step
+    return None
 
 
 def example_two_step_login():
     """Example 2: Two-step login flow (recommended for interactive apps)"""
     print("\n=== Example 2: Two-Step Login Flow ===")
     
-    client = CirtusAIClient(base_url="http://localhost:8000")
+    client = _get_shared_client()
     
     try:
         # Step 1: Initial login
         print("🔐 Step 1: Initial login...")
         login_result = client.auth.login("example@test.com", "SecurePass123!")
         
-        if hasattr(login_result, 'requires_2fa') and login_result.requires_2fa:
+        if isinstance(login_result, TwoFactorRequiredResponse):
             print("🔒 2FA required!")
             print(f"📱 Preferred method: {login_result.preferred_method}")
             print(f"⏰ Temporary token expires in 5 minutes")
@@ -96,13 +168,11 @@ def example_two_step_login():
             
             print("✅ 2FA verification successful!")
             print(f"🎫 Access token: {token.access_token[:20]}...")
-            
-            # Set token for authenticated requests
-            client.set_token(token.access_token)
+            # verify_2fa has already set the token for authenticated requests
             
         else:
+            # login has already set the token for authenticated requests
             print("✅ No 2FA required - direct login successful!")
-            client.set_token(login_result.access_token)
         
         # Test authenticated request
         status = client.auth.get_2fa_status()
@@ -110,19 +180,17 @@ def example_two_step_login():
         
     except TwoFactorAuthenticationError as e:
         print(f"❌ 2FA failed: {e}")
-        if "time_step" in str(e):
+        if e.code == TwoFactorAuthenticationError.TIME_SKEW:
             print("💡 Tip: Check your device time synchronization")
     except Exception as e:
         print(f"❌ Login failed: {e}")
-    finally:
-        client.close()
 
 
 def example_one_step_login():
     """Example 3: One-step login flow (convenience method)"""
     print("\n=== Example 3: One-Step Login Flow ===")
     
-    client = CirtusAIClient(base_url="http://localhost:8000")
+    client = _get_shared_client()
     
     try:
         # Get TOTP code from user
@@ -138,36 +206,33 @@ def example_one_step_login():
         print("✅ One-step login successful!")
         print(f"🎫 Access token: {token.access_token[:20]}...")
         
-        # Set token and test
-        client.set_token(token.access_token)
+        # The token is already set on the client by login_with_2fa
         status = client.auth.get_2fa_status()
         print(f"📊 2FA Status: {status}")
         
     except TwoFactorAuthenticationError as e:
         print(f"❌ 2FA failed: {e}")
-        if "Invalid TOTP code" in str(e):
+        if e.code == TwoFactorAuthenticationError.INVALID_TOTP:
             print("💡 Tip: Make sure you're using the current code from your authenticator app")
     except Exception as e:
         print(f"❌ Login failed: {e}")
-    finally:
-        client.close()
 
 
 def example_2fa_management():
     """Example 4: 2FA management and debugging"""
     print("\n=== Example 4: 2FA Management ===")
     
-    client = CirtusAIClient(base_url="http://localhost:8000")
+    client = _get_shared_client()
     
     try:
         # Login first
         totp_code = input("Enter your TOTP code to login: ")
-        token = client.auth.login_with_2fa("example@test.com", "SecurePass123!", totp_code)
-        client.set_token(token.access_token)
+        client.auth.login_with_2fa("example@test.com", "SecurePass123!", totp_code)
         
-        # Check 2FA status
+        # Check 2FA status; use_cache=True may return a copy cached for up to
+        # 30 seconds, so it will not reflect a change made in the meantime
         print("📊 Checking 2FA status...")
-        status = client.auth.get_2fa_status()
+        status = client.auth.get_2fa_status(use_cache=True)
         print(f"✅ 2FA enabled: {status.is_2fa_enabled}")
         print(f"📱 Preferred method: {status.preferred_2fa_method}")
         print(f"📧 SMS enabled: {status.is_sms_enabled}")
@@ -179,6 +244,9 @@ def example_2fa_management():
         print("⏰ Valid codes right now:")
         for step, code in debug_info["valid_codes"].items():
             print(f"   {step}: {code}")
+        matched_step = _matching_time_step(debug_info, totp_code)
+        if matched_step is not None:
+            print(f"🧭 The code you logged in with matches time step: {matched_step}")
         
         # Get QR code
         print("\n📱 Getting QR code...")
@@ -198,15 +266,13 @@ def example_2fa_management():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-    finally:
-        client.close()
 
 
 def example_error_handling():
     """Example 5: Comprehensive error handling"""
     print("\n=== Example 5: Error Handling ===")
     
-    client = CirtusAIClient(base_url="http://localhost:8000")
+    client = _get_shared_client()
     
     # Test wrong password
     print("🧪 Testing wrong password...")
@@ -219,7 +285,7 @@ def example_error_handling():
     print("\n🧪 Testing wrong TOTP code...")
     try:
         login_result = client.auth.login("example@test.com", "SecurePass123!")
-        if hasattr(login_result, 'requires_2fa'):
+        if isinstance(login_result, TwoFactorRequiredResponse):
             client.auth.verify_2fa(login_result.temporary_token, "000000")
     except TwoFactorAuthenticationError as e:
         print(f"✅ Caught wrong TOTP: {e}")
@@ -232,15 +298,13 @@ def example_error_handling():
         client.auth.verify_2fa("expired.token.here", "123456")
     except Exception as e:
         print(f"✅ Caught expired token: {e}")
-    
-    client.close()
 
 
 async def example_async_client():
     """Example 6: Async client usage"""
     print("\n=== Example 6: Async Client ===")
     
-    client = AsyncCirtusAIClient(base_url="http://localhost:8000")
+    client = await _get_async_client()
     
     try:
         # Async registration
@@ -257,60 +321,113 @@ async def example_async_client():
         # Async login
         print("\n🔐 Async login...")
         totp_code = input("Enter TOTP code for async user: ")
-        token = await client.auth.login_with_2fa(
+        await client.auth.login_with_2fa(
             "async@test.com",
             "SecurePass123!",
             totp_code
         )
         
-        await client.set_token(token.access_token)
         print("✅ Async login successful!")
         
-        # Async 2FA status
+        # Async 2FA status; each step here needs the previous one's session, so
+        # there is nothing independent to gather (see example 7 for that)
         status = await client.auth.get_2fa_status()
         print(f"📊 Async 2FA status: {status}")
         
     except Exception as e:
         print(f"❌ Async error: {e}")
-    finally:
-        await client.close()
+
+
+async def example_error_handling_async():
+    """Example 7: Error handling with the independent probes run concurrently"""
+    print("\n=== Example 7: Async Error Handling ===")
+    
+    client = await _get_async_client()
+    
+    async def probe_wrong_password():
+        await client.auth.login("example@test.com", "wrong_password")
+    
+    async def probe_wrong_totp():
+        login_result = await client.auth.login("example@test.com", "SecurePass123!")
+        if isinstance(login_result, TwoFactorRequiredResponse):
+            await client.auth.verify_2fa(login_result.temporary_token, "000000")
+    
+    async def probe_expired_token():
+        await client.auth.verify_2fa("expired.token.here", "123456")
+    
+    # The probes don't depend on each other, so total latency is one round-trip rather than three
+    print("🧪 Testing wrong password, wrong TOTP code and expired token...")
+    results = await asyncio.gather(
+        probe_wrong_password(),
+        probe_wrong_totp(),
+        probe_expired_token(),
+        return_exceptions=True
+    )
+    
+    for label, result in zip(("wrong password", "wrong TOTP", "expired token"), results):
+        if isinstance(result, AsyncTwoFactorAuthenticationError):
+            print(f"✅ Caught {label} ({result.code}): {result}")
+        elif isinstance(result, Exception):
+            print(f"✅ Caught {label}: {result}")
+        else:
+            print(f"⚠️ No error raised for {label}")
+
+
+def _run_async_example():
+    """Run the async client example on the shared event loop."""
+    _get_event_loop().run_until_complete(example_async_client())
+
+
+def _run_async_error_handling_example():
+    """Run the async error handling example on the shared event loop."""
+    _get_event_loop().run_until_complete(example_error_handling_async())
+
+
+EXAMPLES = (
+    ("Registration with 2FA Setup", example_registration_and_2fa_setup),
+    ("Two-Step Login Flow", example_two_step_login),
+    ("One-Step Login Flow", example_one_step_login),
+    ("2FA Management", example_2fa_management),
+    ("Error Handling", example_error_handling),
+    ("Async Client", _run_async_example),
+    ("Async Error Handling", _run_async_error_handling_example),
+)
+
+
+def _run_all():
+    """Run every example in menu order."""
+    for name, func in EXAMPLES:
+        print(f"\n{_BANNER20} {name} {_BANNER20}")
+        func()
+
+
+_DISPATCH: Dict[str, Callable[[], None]] = {"0": _run_all}
+_DISPATCH.update((str(i), func) for i, (_, func) in enumerate(EXAMPLES, 1))
 
 
 def main():
     """Run all examples"""
-    print("🚀 CirtusAI SDK Examples with Two-Factor Authentication")
-    print("="*60)
-    
-    examples = [
-        ("Registration with 2FA Setup", example_registration_and_2fa_setup),
-        ("Two-Step Login Flow", example_two_step_login),
-        ("One-Step Login Flow", example_one_step_login),
-        ("2FA Management", example_2fa_management),
-        ("Error Handling", example_error_handling),
-        ("Async Client", lambda: asyncio.run(example_async_client())),
+    # Emit the banner and menu in one write
+    lines = [
+        "🚀 CirtusAI SDK Examples with Two-Factor Authentication",
+        _BANNER60,
+        "",
+        "Available examples:",
     ]
-    
-    print("Available examples:")
-    for i, (name, _) in enumerate(examples, 1):
-        print(f"{i}. {name}")
-    print("0. Run all examples")
+    lines.extend(f"{i}. {name}" for i, (name, _) in enumerate(EXAMPLES, 1))
+    lines.append("0. Run all examples")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     try:
-        choice = int(input("\nSelect example (0-6): "))
-        
-        if choice == 0:
-            for name, func in examples:
-                print(f"\n{'='*20} {name} {'='*20}")
-                func()
-        elif 1 <= choice <= len(examples):
-            examples[choice-1][1]()
+        choice = input(f"\nSelect example (0-{len(EXAMPLES)}): ").strip()
+        func = _DISPATCH.get(choice)
+        if func is not None:
+            func()
         else:
             print("❌ Invalid choice")
             
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
-    except ValueError:
-        print("❌ Please enter a number")
 
 
 if __name__ == "__main__":
@@ -1,20 +1,38 @@
 
 
+import functools
 import os
+from types import MappingProxyType
+from typing import Mapping
 from unittest.mock import MagicMock
 from dotenv import load_dotenv
 from cirtusai.agent import CirtusAgent
 from cirtusai.executor import create_agent_executor
 
-# Load environment variables from .env file
-load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _env() -> Mapping[str, str]:
+    """Load the .env file once and return a read-only snapshot of the environment."""
+    load_dotenv()
+    return MappingProxyType(dict(os.environ))
 
 # --- Configuration ---
 # IMPORTANT: Set your actual DeepSeek API key here or in your environment
-DEEPSEEK_API_KEY = os.environ.get("DEEPSEEK_API_KEY", "YOUR_DEEPSEEK_API_KEY_HERE")
+DEEPSEEK_API_KEY = _env().get("DEEPSEEK_API_KEY", "YOUR_DEEPSEEK_API_KEY_HERE")
 AGENT_ID = "test-agent-123"
 TOKEN = "test-token"
 
+# --- Canned tool responses ---
+# Built once and shared by every mocked call. They keep the plain dict/list shapes
+# CirtusAgent returns, so treat them as read-only rather than mutating results.
+_MASTER = {"id": "master-001", "name": "MasterAgent", "did": "did:key:z6Mkt..."}
+_ASSETS = {"wallets": [{"id": "w-123", "chain": "ethereum"}], "emails": [{"id": "e-456", "address": "test@example.com"}]}
+_PROVISIONED_EMAIL = {"status": "success", "asset_id": "e-789", "message": "Email provisioned."}
+_PROVISIONED_WALLET = {"status": "success", "asset_id": "w-abc", "chain": "solana"}
+_COMMAND = {"status": "received", "message_id": "msg-xyz"}
+_EMAIL_ACCOUNTS = [{"id": "e-456", "provider": "gmail", "email_address": "test@example.com"}]
+_CREATED_EMAIL_ACCOUNT = {"status": "created", "account_id": "e-new"}
+_CREDENTIAL = {"credential": {"jws": "ey..."}, "message": "Credential issued."}
+
 # --- Mocking CirtusAgent for Local Testing ---
 def get_mocked_cirtus_agent():
     """Creates a CirtusAgent with mocked methods to simulate API calls."""
@@ -22,14 +40,14 @@ def get_mocked_cirtus_agent():
     mock_agent = MagicMock(spec=CirtusAgent)
 
     # Define return values for each tool the agent can use
-    mock_agent.list_master_agent.return_value = {"id": "master-001", "name": "MasterAgent", "did": "did:key:z6Mkt..."}
-    mock_agent.list_assets.return_value = {"wallets": [{"id": "w-123", "chain": "ethereum"}], "emails": [{"id": "e-456", "address": "test@example.com"}]}
-    mock_agent.provision_email.return_value = {"status": "success", "asset_id": "e-789", "message": "Email provisioned."}
-    mock_agent.provision_wallet.return_value = {"status": "success", "asset_id": "w-abc", "chain": "solana"}
-    mock_agent.command.return_value = {"status": "received", "message_id": "msg-xyz"}
-    mock_agent.list_email_accounts.return_value = [{"id": "e-456", "provider": "gmail", "email_address": "test@example.com"}]
-    mock_agent.create_email_account.return_value = {"status": "created", "account_id": "e-new"}
-    mock_agent.issue_credential.return_value = {"credential": {"jws": "ey..."}, "message": "Credential issued."}
+    mock_agent.list_master_agent.return_value = _MASTER
+    mock_agent.list_assets.return_value = _ASSETS
+    mock_agent.provision_email.return_value = _PROVISIONED_EMAIL
+    mock_agent.provision_wallet.return_value = _PROVISIONED_WALLET
+    mock_agent.command.return_value = _COMMAND
+    mock_agent.list_email_accounts.return_value = _EMAIL_ACCOUNTS
+    mock_agent.create_email_account.return_value = _CREATED_EMAIL_ACCOUNT
+    mock_agent.issue_credential.return_value = _CREDENTIAL
 
     return mock_agent
 
@@ -4,7 +4,19 @@ class AgentExecutor:
         self.agent = agent
         self.tools = tools
         self.verbose = verbose
+        # Name -> tool dispatch table so routing doesn't scan the tool list
+        self._tool_map = {t.name: t for t in tools}
 
     def invoke(self, input_dict):
-        """Stub invocation returning a fixed response"""
-        return {"output": "stub-response"}
+        """
+        Stub invocation: run the tool named by an explicit "intent", else return a fixed response.
+
+        Tool arguments come from "args", either a list of positional values or a dict of keywords.
+        """
+        tool = self._tool_map.get(input_dict.get("intent"))
+        if tool is None:
+            return {"output": "stub-response"}
+        args = input_dict.get("args", ())
+        if isinstance(args, dict):
+            return {"output": tool.func(**args)}
+        return {"output": tool.func(*args)}
@@ -1,6 +1,18 @@
 # Stub module for langchain_deepseek
+import functools
+
+
 class ChatDeepSeek:
+    def __new__(cls, model: str, api_key: str, temperature: float = 0):
+        # Repeated constructions with the same settings reuse one model object
+        return _cached_chat_model(cls, model, api_key, temperature)
+
     def __init__(self, model: str, api_key: str, temperature: float = 0):
         self.model = model
         self.api_key = api_key
         self.temperature = temperature
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_chat_model(cls, model, api_key, temperature):
+    return object.__new__(cls)
@@ -13,7 +13,7 @@ setup(
     packages=find_packages(include=["cirtusai", "cirtusai.*"]),
     install_requires=[
         "requests>=2.0.0",
-        "httpx>=0.24.0",
+        "httpx[http2]>=0.24.0",
         "click>=8.0.0",
         "langchain>=0.1.0",
         "langchain-deepseek>=0.0.1",
@@ -26,6 +26,9 @@ setup(
         ]
     },
     extras_require={
+        'fast': [
+            'orjson>=3.0.0'
+        ],
         'dev': [
             'pytest>=7.0.0',
             'pytest-asyncio>=0.20.0',
@@ -29,6 +29,13 @@ def test_get_children(client):
     responses.add(responses.GET, f"{API_URL}/agents/children", json=data, status=200)
     assert client.agents.get_children() == data
 
+@responses.activate
+def test_get_child(client):
+    child_id = "c1"
+    data = {"id": child_id, "permissions_granted": ["email:read"]}
+    responses.add(responses.GET, f"{API_URL}/agents/children/{child_id}", json=data, status=200)
+    assert client.agents.get_child(child_id) == data
+
 @responses.activate
 def test_create_child_agent(client):
     payload = {"parent_id": "a1", "name": "child"}
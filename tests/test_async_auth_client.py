@@ -141,6 +141,7 @@ class TestAsyncLoginFlow:
             assert isinstance(result, Token)
             assert result.access_token.startswith("eyJ0eXA")
             assert result.token_type == "bearer"
+            assert auth_client.client.headers["Authorization"] == f"Bearer {result.access_token}"
 
     @pytest.mark.asyncio
     async def test_login_with_2fa_required(self, auth_client):
@@ -192,6 +193,7 @@ class TestAsyncTwoFactorVerification:
             assert isinstance(result, Token)
             assert result.access_token.startswith("eyJ0eXA")
             assert result.token_type == "bearer"
+            assert auth_client.client.headers["Authorization"] == f"Bearer {result.access_token}"
 
     @pytest.mark.asyncio
     async def test_verify_2fa_invalid_code(self, auth_client):
@@ -206,6 +208,7 @@ class TestAsyncTwoFactorVerification:
             
             assert "Invalid TOTP code" in str(exc_info.value)
             assert "Valid codes right now" in str(exc_info.value)
+            assert exc_info.value.code == TwoFactorAuthenticationError.INVALID_TOTP
 
     @pytest.mark.asyncio
     async def test_verify_2fa_expired_token(self, auth_client):
@@ -217,6 +220,7 @@ class TestAsyncTwoFactorVerification:
                 await auth_client.verify_2fa("expired_token", "123456")
             
             assert "expired temporary token" in str(exc_info.value)
+            assert exc_info.value.code == TwoFactorAuthenticationError.EXPIRED_TEMP_TOKEN
 
 
 class TestAsyncConvenienceMethods:
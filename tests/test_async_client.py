@@ -33,6 +33,15 @@ async def test_async_create_child_agent():
         assert data == {"id": "c1"}
     await client.close()
 
+@pytest.mark.asyncio
+async def test_async_get_child():
+    client = AsyncCirtusAIClient(base_url=API_URL, token=TOKEN)
+    async with respx.mock(base_url=API_URL) as route:
+        route.get("/agents/children/c1").respond(200, json={"id": "c1", "permissions_granted": ["email:read"]})
+        data = await client.agents.get_child("c1")
+        assert data == {"id": "c1", "permissions_granted": ["email:read"]}
+    await client.close()
+
 @pytest.mark.asyncio
 async def test_async_list_assets():
     client = AsyncCirtusAIClient(base_url=API_URL, token=TOKEN)
@@ -51,3 +60,16 @@ async def test_async_issue_credential():
         data = await client.identity.issue_credential("s1", ["VerifiableCredential"], {"k":"v"})
         assert data == {"credential": "abc"}
     await client.close()
+
+@pytest.mark.asyncio
+async def test_async_client_transport_defaults():
+    client = AsyncCirtusAIClient(base_url=API_URL, token=TOKEN)
+    assert client.client.timeout.connect == 5.0
+    assert client.client.timeout.read == 30.0
+    await client.close()
+
+@pytest.mark.asyncio
+async def test_async_client_kwargs_override_defaults():
+    client = AsyncCirtusAIClient(base_url=API_URL, token=TOKEN, timeout=10.0)
+    assert client.client.timeout.read == 10.0
+    await client.close()
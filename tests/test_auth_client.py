@@ -158,6 +158,7 @@ class TestLoginFlow:
         assert isinstance(result, Token)
         assert result.access_token.startswith("eyJ0eXA")
         assert result.token_type == "bearer"
+        assert auth_client.session.headers["Authorization"] == f"Bearer {result.access_token}"
 
     @responses.activate
     def test_login_with_2fa_required(self, auth_client):
@@ -181,6 +182,7 @@ class TestLoginFlow:
         assert result.temporary_token.startswith("eyJ0eXA")
         assert result.preferred_method == "totp"
         assert "verify-2fa" in result.message
+        assert "Authorization" not in auth_client.session.headers
 
     @responses.activate
     def test_login_invalid_credentials(self, auth_client):
@@ -223,6 +225,7 @@ class TestTwoFactorVerification:
         assert isinstance(result, Token)
         assert result.access_token.startswith("eyJ0eXA")
         assert result.token_type == "bearer"
+        assert auth_client.session.headers["Authorization"] == f"Bearer {result.access_token}"
 
     @responses.activate
     def test_verify_2fa_invalid_code(self, auth_client):
@@ -239,6 +242,7 @@ class TestTwoFactorVerification:
         
         assert "Invalid TOTP code" in str(exc_info.value)
         assert "Valid codes right now" in str(exc_info.value)
+        assert exc_info.value.code == TwoFactorAuthenticationError.INVALID_TOTP
 
     @responses.activate 
     def test_verify_2fa_expired_token(self, auth_client):
@@ -254,6 +258,22 @@ class TestTwoFactorVerification:
             auth_client.verify_2fa("expired_token", "123456")
         
         assert "expired temporary token" in str(exc_info.value)
+        assert exc_info.value.code == TwoFactorAuthenticationError.EXPIRED_TEMP_TOKEN
+
+    @responses.activate
+    def test_verify_2fa_server_error_code(self, auth_client):
+        """Test an error code supplied by the server takes precedence."""
+        responses.add(
+            responses.POST,
+            f"{API_URL}/auth/verify-2fa",
+            json={"detail": "Code outside the accepted window", "code": "TIME_SKEW"},
+            status=401
+        )
+        
+        with pytest.raises(TwoFactorAuthenticationError) as exc_info:
+            auth_client.verify_2fa("temp_token_123", "123456")
+        
+        assert exc_info.value.code == TwoFactorAuthenticationError.TIME_SKEW
 
 
 class TestConvenienceMethods:
@@ -398,6 +418,22 @@ class TestTwoFactorManagement:
         
         assert result["message"] == "2FA has been successfully enabled"
 
+    @responses.activate
+    def test_confirm_2fa_sends_compact_json_body(self, auth_client):
+        """Test request payloads are pre-encoded as compact JSON bytes."""
+        responses.add(
+            responses.POST,
+            f"{API_URL}/auth/2fa/confirm",
+            json={"message": "2FA has been successfully enabled"},
+            status=200
+        )
+        
+        auth_client.confirm_2fa("123456")
+        
+        request = responses.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.body == b'{"totp_code":"123456"}'
+
     @responses.activate
     def test_disable_2fa(self, auth_client):
         """Test disabling 2FA."""
@@ -451,6 +487,73 @@ class TestTwoFactorManagement:
         assert result["message"] == "SMS code sent successfully"
         assert result["expires_in"] == 300
 
+    @responses.activate
+    def test_get_2fa_status_cached(self, auth_client):
+        """Cached status lookups reuse the first response until invalidated."""
+        responses.add(
+            responses.GET,
+            f"{API_URL}/auth/2fa/status",
+            json={
+                "is_2fa_enabled": True,
+                "preferred_2fa_method": "totp",
+                "is_sms_enabled": False
+            },
+            status=200
+        )
+
+        first = auth_client.get_2fa_status(use_cache=True)
+        second = auth_client.get_2fa_status(use_cache=True)
+        assert second is first
+        assert len(responses.calls) == 1
+
+        auth_client.invalidate_cache()
+        auth_client.get_2fa_status(use_cache=True)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_get_2fa_status_cache_keyed_by_token(self, auth_client):
+        """A different Authorization header does not see another token's cached status."""
+        responses.add(
+            responses.GET,
+            f"{API_URL}/auth/2fa/status",
+            json={
+                "is_2fa_enabled": False,
+                "preferred_2fa_method": None,
+                "is_sms_enabled": False
+            },
+            status=200
+        )
+
+        auth_client.get_2fa_status(use_cache=True)
+        auth_client.session.headers["Authorization"] = "Bearer other-token"
+        auth_client.get_2fa_status(use_cache=True)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_disable_2fa_invalidates_cache(self, auth_client):
+        """Mutating 2FA calls drop cached status."""
+        responses.add(
+            responses.GET,
+            f"{API_URL}/auth/2fa/status",
+            json={
+                "is_2fa_enabled": True,
+                "preferred_2fa_method": "totp",
+                "is_sms_enabled": False
+            },
+            status=200
+        )
+        responses.add(
+            responses.POST,
+            f"{API_URL}/auth/2fa/disable",
+            json={"message": "2FA disabled"},
+            status=200
+        )
+
+        auth_client.get_2fa_status(use_cache=True)
+        auth_client.disable_2fa("123456", "password")
+        auth_client.get_2fa_status(use_cache=True)
+        assert len(responses.calls) == 3
+
 
 class TestDebugEndpoints:
     """Test debug and troubleshooting endpoints."""
@@ -51,3 +51,19 @@ def test_issue_credential(client):
     )
     resp = client.identity.issue_credential("sub", ["VerifiableCredential"], {"k": "v"})
     assert resp == data
+
+@responses.activate
+def test_request_defaults_applied_per_call():
+    client = CirtusAIClient(base_url=API_URL, token=TOKEN, timeout=30)
+    responses.add(responses.GET, f"{API_URL}/agents", json=[], status=200)
+    client.agents.list_agents()
+    assert responses.calls[0].request.req_kwargs["timeout"] == 30
+    # Defaults live on the session subclass instead of shadowing Session.request
+    assert "request" not in vars(client.session)
+
+@responses.activate
+def test_request_defaults_overridden_by_call_kwargs():
+    client = CirtusAIClient(base_url=API_URL, token=TOKEN, timeout=30)
+    responses.add(responses.GET, f"{API_URL}/agents", json=[], status=200)
+    client.session.get(f"{API_URL}/agents", timeout=5)
+    assert responses.calls[0].request.req_kwargs["timeout"] == 5
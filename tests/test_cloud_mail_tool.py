@@ -0,0 +1,510 @@
+import json
+import os
+import sys
+from types import SimpleNamespace
+from typing import List
+from urllib.parse import parse_qs, urlparse
+import pytest
+import requests
+import httpx
+import respx
+import responses
+from unittest.mock import MagicMock, AsyncMock
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Email_Agent_Test", "email_summarizer_agent"))
+
+import cloud_mail_tool
+from cirtusai.schemas import Token
+from cloud_mail_tool import _AuthCache, _clean_email, AsyncCloudMailClient, CloudMailClient, CloudMailReadAndSummarizeEmailTool
+
+AGENT_ID = "child-1"
+MASTER_AGENT = {
+    "state": {
+        "linked_children": [
+            {"child_agent_id": AGENT_ID, "permissions_granted": ["read_email"]}
+        ]
+    }
+}
+
+
+def _http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def _httpx_error(status_code):
+    request = httpx.Request("GET", f"http://test/agents/children/{AGENT_ID}")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status_code, request=request))
+
+
+@pytest.fixture(autouse=True)
+def auth_cache(monkeypatch):
+    """Give every test a fresh module-level auth cache."""
+    cache = _AuthCache()
+    monkeypatch.setattr(cloud_mail_tool, "_auth_cache", cache)
+    return cache
+
+
+class TestChildPermissions:
+    """Resolving child agent permissions via the per-child route or the master agent."""
+
+    def test_get_child_route(self):
+        client = MagicMock()
+        client.agents.get_child.return_value = {"permissions_granted": ["send_email"]}
+
+        assert cloud_mail_tool._fetch_child_permissions(client, AGENT_ID) == ["send_email"]
+        client.agents.get_child.assert_called_once_with(AGENT_ID)
+        client.agents.list_agents.assert_not_called()
+
+    @pytest.mark.parametrize("status_code", [404, 405])
+    def test_falls_back_to_list_agents_when_route_missing(self, status_code):
+        client = MagicMock()
+        client.agents.get_child.side_effect = _http_error(status_code)
+        client.agents.list_agents.return_value = MASTER_AGENT
+
+        assert cloud_mail_tool._fetch_child_permissions(client, AGENT_ID) == ["read_email"]
+        client.agents.list_agents.assert_called_once_with()
+
+    def test_fallback_unknown_child(self):
+        client = MagicMock()
+        client.agents.get_child.side_effect = _http_error(404)
+        client.agents.list_agents.return_value = {"state": {"linked_children": []}}
+
+        with pytest.raises(LookupError, match="not found"):
+            cloud_mail_tool._fetch_child_permissions(client, AGENT_ID)
+
+    @pytest.mark.parametrize("status_code", [401, 403])
+    def test_auth_errors_are_not_treated_as_missing_route(self, status_code):
+        client = MagicMock()
+        client.agents.get_child.side_effect = _http_error(status_code)
+
+        with pytest.raises(requests.HTTPError):
+            cloud_mail_tool._fetch_child_permissions(client, AGENT_ID)
+        client.agents.list_agents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_falls_back_on_405(self):
+        client = MagicMock()
+        client.agents.get_child = AsyncMock(side_effect=_httpx_error(405))
+        client.agents.list_agents = AsyncMock(return_value=MASTER_AGENT)
+
+        assert await cloud_mail_tool._afetch_child_permissions(client, AGENT_ID) == ["read_email"]
+
+
+def _summarize_tool(**kwargs):
+    kwargs.setdefault("llm", FakeListChatModel(responses=["direct summary"]))
+    return CloudMailReadAndSummarizeEmailTool(
+        client=MagicMock(),
+        agent_id=AGENT_ID,
+        username="user",
+        password="pass",
+        cloud_mail_client=CloudMailClient("mail.test", "me@test.com", "secret"),
+        **kwargs
+    )
+
+
+def _batch_client(output_lines):
+    batch_client = MagicMock()
+    batch_client.files.create.return_value = SimpleNamespace(id="file-in")
+    batch_client.batches.create.return_value = SimpleNamespace(id="batch-1", status="completed", output_file_id="file-out")
+    batch_client.files.content.return_value = SimpleNamespace(text="\n".join(json.dumps(line) for line in output_lines))
+    return batch_client
+
+
+def _batch_record(custom_id, content):
+    return {"custom_id": custom_id, "response": {"body": {"choices": [{"message": {"content": content}}]}}}
+
+
+class TestBatchSummaries:
+    """Summarizing through a provider batch job."""
+
+    def test_batch_api_requires_client(self):
+        with pytest.raises(ValueError, match="batch_client"):
+            _summarize_tool(use_batch_api=True)
+
+    def test_batch_api_requires_reachable_threshold(self):
+        with pytest.raises(ValueError, match="batch_threshold"):
+            _summarize_tool(use_batch_api=True, batch_client=MagicMock(), max_emails=10, batch_threshold=50)
+
+    def test_unfinished_batch_is_cancelled_and_summarized_directly(self):
+        batch_client = _batch_client([])
+        batch_client.batches.create.return_value = SimpleNamespace(id="batch-1", status="in_progress")
+        batch_client.batches.retrieve.return_value = SimpleNamespace(id="batch-1", status="in_progress")
+        tool = _summarize_tool(
+            use_batch_api=True, batch_client=batch_client, batch_threshold=2,
+            batch_poll_interval=0.01, batch_max_wait=0.03
+        )
+
+        assert tool._summarize_with_batch_api(["a", "b"]) == ["direct summary", "direct summary"]
+        batch_client.batches.cancel.assert_called_once_with("batch-1")
+        batch_client.files.content.assert_not_called()
+
+    def test_duplicate_bodies_share_one_record(self):
+        batch_client = _batch_client([_batch_record("0", "first"), _batch_record("1", "second")])
+        tool = _summarize_tool(use_batch_api=True, batch_client=batch_client, batch_threshold=2)
+
+        assert tool._summarize_with_batch_api(["a", "b", "a"]) == ["first", "second", "first"]
+
+    def test_failed_records_are_summarized_directly(self):
+        batch_client = _batch_client([
+            _batch_record("0", "first"),
+            {"custom_id": "1", "error": {"code": "server_error", "message": "boom"}},
+        ])
+        tool = _summarize_tool(use_batch_api=True, batch_client=batch_client, batch_threshold=2)
+
+        assert tool._summarize_with_batch_api(["a", "b"]) == ["first", "direct summary"]
+
+
+def _sdk_client():
+    client = MagicMock()
+    client.auth.login.return_value = Token(access_token="token-1", refresh_token="refresh-1")
+    return client
+
+
+class TestAuthCache:
+    """Reusing the CirtusAI login and permissions across tool calls."""
+
+    def test_login_is_cached(self, auth_cache):
+        client = _sdk_client()
+
+        cloud_mail_tool._authenticate(client, "user", "pass")
+        cloud_mail_tool._authenticate(client, "user", "pass")
+
+        client.auth.login.assert_called_once_with("user", "pass")
+        # login() sets the token itself; only the cache hit reapplies it
+        client.set_token.assert_called_once_with("token-1")
+        assert auth_cache.token == "token-1"
+        assert auth_cache.refresh_token == "refresh-1"
+
+    def test_expired_login_is_repeated(self, auth_cache):
+        client = _sdk_client()
+
+        cloud_mail_tool._authenticate(client, "user", "pass")
+        auth_cache.expires_at = 0.0
+        cloud_mail_tool._authenticate(client, "user", "pass")
+
+        assert client.auth.login.call_count == 2
+
+    def test_cache_is_keyed_by_username(self):
+        client = _sdk_client()
+
+        cloud_mail_tool._authenticate(client, "user", "pass")
+        cloud_mail_tool._authenticate(client, "other", "pass")
+
+        assert [c.args[0] for c in client.auth.login.call_args_list] == ["user", "other"]
+
+    def test_permissions_are_cached(self):
+        client = _sdk_client()
+        client.agents.get_child.return_value = {"permissions_granted": ["read_email"]}
+
+        cloud_mail_tool._authenticate(client, "user", "pass")
+        for _ in range(2):
+            assert cloud_mail_tool._get_permissions(client, AGENT_ID, "user", "pass") == ["read_email"]
+
+        client.agents.get_child.assert_called_once_with(AGENT_ID)
+
+    def test_new_login_clears_cached_permissions(self, auth_cache):
+        client = _sdk_client()
+        client.agents.get_child.return_value = {"permissions_granted": ["read_email"]}
+
+        cloud_mail_tool._authenticate(client, "user", "pass")
+        cloud_mail_tool._get_permissions(client, AGENT_ID, "user", "pass")
+        auth_cache.expires_at = 0.0
+        cloud_mail_tool._authenticate(client, "user", "pass")
+        cloud_mail_tool._get_permissions(client, AGENT_ID, "user", "pass")
+
+        assert client.agents.get_child.call_count == 2
+
+    def test_401_refreshes_token_and_retries(self, auth_cache):
+        client = _sdk_client()
+        client.auth.refresh.return_value = {"access_token": "token-2"}
+        client.agents.get_child.side_effect = [_http_error(401), {"permissions_granted": ["send_email"]}]
+
+        cloud_mail_tool._authenticate(client, "user", "pass")
+        assert cloud_mail_tool._get_permissions(client, AGENT_ID, "user", "pass") == ["send_email"]
+
+        client.auth.refresh.assert_called_once_with("refresh-1")
+        client.set_token.assert_called_with("token-2")
+        client.auth.login.assert_called_once()
+        assert auth_cache.token == "token-2"
+        assert auth_cache.refresh_token == "refresh-1"
+
+    def test_401_logs_in_again_when_refresh_fails(self, auth_cache):
+        client = _sdk_client()
+        client.auth.refresh.side_effect = _http_error(401)
+        client.agents.get_child.side_effect = [_http_error(401), {"permissions_granted": ["send_email"]}]
+
+        cloud_mail_tool._authenticate(client, "user", "pass")
+        assert cloud_mail_tool._get_permissions(client, AGENT_ID, "user", "pass") == ["send_email"]
+
+        assert client.auth.login.call_count == 2
+        assert auth_cache.token == "token-1"
+
+
+class RecordingChatModel(FakeListChatModel):
+    """Fake LLM that records each email body it is asked to summarize."""
+    responses: List[str] = ["unused"]
+    prompts: List[str] = []
+
+    def _call(self, messages, *args, **kwargs):
+        body = messages[-1].content
+        self.prompts.append(body)
+        return f"summary: {body}"
+
+
+def _inbox_tool(messages, **kwargs):
+    """Build a summarize tool whose agent may read mail and whose inbox holds the given messages."""
+    client = _sdk_client()
+    client.agents.get_child.return_value = {"permissions_granted": ["read_email"]}
+    tool = _summarize_tool(llm=RecordingChatModel(), max_concurrency=1, **kwargs)
+    tool.client = client
+    tool.cloud_mail_client.get_user_info = MagicMock(return_value={"accountId": 7, "name": "Me"})
+    tool.cloud_mail_client.iter_emails = MagicMock(side_effect=lambda account_id, page_size: iter(list(messages)))
+    return tool
+
+
+def _email(email_id, text):
+    return {"emailId": email_id, "sendEmail": f"sender{email_id}@test.com", "subject": f"Subject {email_id}", "text": text}
+
+
+class TestInboxPaging:
+    """CloudMailClient.iter_emails reads the inbox one page at a time."""
+
+    @responses.activate
+    def test_iter_emails_pages_until_short_page(self):
+        responses.post("http://mail.test/api/login", json={"data": {"token": "mail-token"}})
+        responses.get("http://mail.test/api/email/list", json={"data": {"list": [_email(5, "a"), _email(4, "b")]}})
+        responses.get("http://mail.test/api/email/list", json={"data": {"list": [_email(3, "c")]}})
+        mail_client = CloudMailClient("http://mail.test", "me@test.com", "secret")
+
+        ids = [m["emailId"] for m in mail_client.iter_emails(7, page_size=2)]
+
+        assert ids == [5, 4, 3]
+        assert responses.calls[0].request.url == "http://mail.test/api/login"
+        listing = [parse_qs(urlparse(call.request.url).query) for call in responses.calls[1:]]
+        assert [params["page"] for params in listing] == [["1"], ["2"]]
+        assert listing[0]["size"] == ["2"]
+        assert responses.calls[1].request.headers["Authorization"] == "mail-token"
+
+
+class TestSummarizeRun:
+    """End-to-end runs of the summarize tool against a fake inbox."""
+
+    def test_longest_emails_are_submitted_first(self):
+        inbox = [_email(3, "short"), _email(2, "a much longer email body"), _email(1, "medium body")]
+        tool = _inbox_tool(inbox)
+
+        result = tool._run()
+
+        assert tool.llm.prompts == ["a much longer email body", "medium body", "short"]
+        # Rows keep the inbox order regardless of submission order
+        assert result.splitlines()[1:] == [
+            "sender3@test.com,Subject 3,summary: short",
+            "sender2@test.com,Subject 2,summary: a much longer email body",
+            "sender1@test.com,Subject 1,summary: medium body",
+        ]
+
+    def test_submission_order_uses_cleaned_length(self):
+        newsletter = _email(2, "<html><style>" + "p { color: red; } " * 50 + "</style><p>Sale today</p></html>")
+        inbox = [newsletter, _email(1, "a plain email that is longer than the sale line")]
+        tool = _inbox_tool(inbox)
+
+        tool._run()
+
+        assert tool.llm.prompts == ["a plain email that is longer than the sale line", "Sale today"]
+
+
+def _async_inbox_tool(messages, **kwargs):
+    """Async counterpart of _inbox_tool using fake async CirtusAI and mail clients."""
+    async_client = MagicMock()
+    async_client.auth.login = AsyncMock(return_value=Token(access_token="token-1"))
+    async_client.set_token = AsyncMock()
+    async_client.agents.get_child = AsyncMock(return_value={"permissions_granted": ["read_email"]})
+    mail_client = AsyncCloudMailClient("mail.test", "me@test.com", "secret")
+    mail_client.get_user_info = AsyncMock(return_value={"accountId": 7, "name": "Me"})
+
+    async def iter_emails(account_id, page_size):
+        for message in messages:
+            yield message
+
+    mail_client.iter_emails = iter_emails
+    return _summarize_tool(
+        llm=RecordingChatModel(),
+        async_client=async_client,
+        async_cloud_mail_client=mail_client,
+        **kwargs
+    )
+
+
+class TestAsyncInbox:
+    """The async tool path reads the same messages as the sync one."""
+
+    @pytest.mark.asyncio
+    async def test_iter_emails_pages_until_short_page(self):
+        mail_client = AsyncCloudMailClient("http://mail.test", "me@test.com", "secret")
+        async with respx.mock(base_url="http://mail.test") as route:
+            route.post("/api/login").respond(200, json={"data": {"token": "mail-token"}})
+            listing = route.get("/api/email/list")
+            listing.side_effect = [
+                httpx.Response(200, json={"data": {"list": [_email(5, "a"), _email(4, "b")]}}),
+                httpx.Response(200, json={"data": {"list": [_email(3, "c")]}}),
+            ]
+
+            ids = [m["emailId"] async for m in mail_client.iter_emails(7, page_size=2)]
+
+        assert ids == [5, 4, 3]
+        assert [call.request.url.params["page"] for call in listing.calls] == ["1", "2"]
+        assert listing.calls[0].request.url.params["size"] == "2"
+        await mail_client.close()
+
+    @pytest.mark.asyncio
+    async def test_arun_honours_max_emails(self):
+        inbox = [_email(i, f"body {i}") for i in range(5, 0, -1)]
+        tool = _async_inbox_tool(inbox, max_emails=3)
+
+        result = await tool._arun()
+
+        rows = result.splitlines()[1:]
+        assert [row.split(",")[0] for row in rows[:-1]] == [
+            "sender5@test.com", "sender4@test.com", "sender3@test.com"
+        ]
+        assert rows[-1].startswith("Note:")
+
+    @pytest.mark.asyncio
+    async def test_arun_summarizes_messages_without_ids(self):
+        inbox = [{"sendEmail": "a@test.com", "subject": "A", "text": "first"},
+                 {"sendEmail": "b@test.com", "subject": "B", "text": "second"}]
+        tool = _async_inbox_tool(inbox)
+
+        result = await tool._arun()
+
+        assert result.splitlines()[1:] == ["a@test.com,A,summary: first", "b@test.com,B,summary: second"]
+        assert result == _inbox_tool(inbox)._run()
+
+    @pytest.mark.asyncio
+    async def test_arun_reports_mail_server_errors_separately(self):
+        tool = _async_inbox_tool([])
+        tool.async_cloud_mail_client.get_user_info.side_effect = RuntimeError("mail server down")
+
+        assert await tool._arun() == "Error reading inbox: mail server down"
+
+    @pytest.mark.asyncio
+    async def test_arun_reports_permission_errors_first(self):
+        tool = _async_inbox_tool([])
+        tool.async_client.agents.get_child.side_effect = RuntimeError("boom")
+        tool.async_client.agents.list_agents = AsyncMock(side_effect=RuntimeError("boom"))
+        tool.async_cloud_mail_client.get_user_info.side_effect = RuntimeError("mail server down")
+
+        assert (await tool._arun()).startswith("Error fetching agent permissions")
+
+
+class TestCursor:
+    """Only emails newer than the last summarized one are read on later runs."""
+
+    def test_cursor_skips_already_summarized(self):
+        inbox = [_email(3, "three"), _email(2, "two"), _email(1, "one")]
+        tool = _inbox_tool(inbox)
+        tool._run()
+
+        inbox.insert(0, _email(4, "four"))
+        result = tool._run()
+
+        assert result.splitlines()[1:] == ["sender4@test.com,Subject 4,summary: four"]
+        assert tool._run() == "No new emails since the last summary."
+
+    def test_cursor_path_round_trip(self, tmp_path):
+        cursor_path = tmp_path / "state" / "cursor.json"
+        inbox = [_email(2, "two"), _email(1, "one")]
+        _inbox_tool(inbox, cursor_path=str(cursor_path))._run()
+
+        assert json.loads(cursor_path.read_text()) == {"7": 2}
+
+        # A fresh tool (e.g. a new process) resumes from the persisted cursor
+        inbox.insert(0, _email(3, "three"))
+        result = _inbox_tool(inbox, cursor_path=str(cursor_path))._run()
+
+        assert result.splitlines()[1:] == ["sender3@test.com,Subject 3,summary: three"]
+        assert json.loads(cursor_path.read_text()) == {"7": 3}
+
+    def test_truncated_results_are_reported(self):
+        inbox = [_email(i, f"body {i}") for i in range(5, 0, -1)]
+        tool = _inbox_tool(inbox, max_emails=2)
+
+        lines = tool._run().splitlines()
+
+        assert len(lines) == 4
+        assert lines[-1].startswith("Note: more than 2 new emails were found")
+
+    def test_exact_limit_is_not_reported_as_truncated(self):
+        inbox = [_email(2, "two"), _email(1, "one")]
+        tool = _inbox_tool(inbox, max_emails=2)
+
+        assert "Note:" not in tool._run()
+
+    @pytest.mark.asyncio
+    async def test_async_truncated_results_are_reported(self):
+        inbox = [_email(i, f"body {i}") for i in range(5, 0, -1)]
+        tool = _async_inbox_tool(inbox, max_emails=2)
+
+        lines = (await tool._arun()).splitlines()
+
+        assert len(lines) == 4
+        assert lines[-1].startswith("Note: more than 2 new emails were found")
+
+
+class TestCleanEmail:
+    """Reducing an email body to the text worth summarizing."""
+
+    def test_plain_text_keeps_angle_bracket_links_and_addresses(self):
+        text = "Link: <https://example.com/reset?token=abc> please click. Contact <bob@example.com>."
+
+        assert _clean_email(text) == text
+
+    def test_plain_text_comparisons_are_not_parsed_as_html(self):
+        assert _clean_email("Check that 2 < 3 and 5 > 4.") == "Check that 2 < 3 and 5 > 4."
+
+    @pytest.mark.parametrize("header", [
+        "On Mon, Jan 1, 2024 at 10:00 AM Bob <bob@x.com> wrote:",
+        "On Mon, Jan 1, 2024 at 10:00 AM Bob <\nbob@x.com> wrote:",
+        "On Mon, Jan 1, 2024 at 10:00 AM Bob wrote:",
+        "-----Original Message-----",
+        "From: Bob Smith <bob@x.com>\nSent: Monday, January 1, 2024 10:00 AM",
+    ])
+    def test_plain_text_reply_history_is_dropped(self, header):
+        text = f"Sounds good, see you then.\n\n{header}\n> earlier message\nold history"
+
+        assert _clean_email(text) == "Sounds good, see you then."
+
+    def test_quoted_lines_are_dropped(self):
+        assert _clean_email("Agreed.\n> quoted line\nThanks") == "Agreed. Thanks"
+
+    def test_gmail_html_quote_is_dropped(self):
+        html = (
+            '<div dir="ltr">Thanks!</div><br><div class="gmail_quote"><div class="gmail_attr">'
+            'On Mon, Jan 1, 2024 Bob &lt;<a href="mailto:b@x.com">b@x.com</a>&gt; wrote:<br></div>'
+            '<blockquote class="gmail_quote">old quoted history</blockquote></div>'
+        )
+
+        assert _clean_email(html) == "Thanks!"
+
+    def test_outlook_html_history_is_dropped(self):
+        html = (
+            '<div>Answer</div><hr><div id="divRplyFwdMsg"><b>From:</b> Bob<br>'
+            '<b>Sent:</b> Monday</div><div>old history</div>'
+        )
+
+        assert _clean_email(html) == "Answer"
+
+    def test_html_inline_text_stays_together(self):
+        html = "<html><head><style>p {color: red}</style></head><body><p>Offer ends <b>today</b> &amp; tomorrow</p><p>Details</p></body></html>"
+
+        assert _clean_email(html) == "Offer ends today & tomorrow Details"
+
+    def test_length_is_capped(self):
+        assert len(_clean_email("word " * 2000)) == cloud_mail_tool.MAX_EMAIL_CHARS
+
+    def test_empty_body(self):
+        assert _clean_email("") == ""
+        assert _clean_email(None) == ""
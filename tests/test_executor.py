@@ -64,3 +64,23 @@ def test_create_agent_executor(MockAgentExecutor, mock_create_agent, mock_chat_d
     # Test 'command' tool
     assert tool_map['command'].func(text="do something") == {"status": "command ok"}
     mock_cirtus_agent.command.assert_called_once_with("do something")
+
+
+def test_invoke_dispatches_intent_to_tool(mock_cirtus_agent):
+    """An explicit intent runs the matching tool, passing its arguments through."""
+    executor = create_agent_executor(mock_cirtus_agent, "sk-testkey")
+
+    assert executor.invoke({"intent": "list_assets"}) == {"output": {"status": "assets ok"}}
+    assert executor.invoke({"intent": "command", "args": ["check status"]}) == {"output": {"status": "command ok"}}
+    mock_cirtus_agent.command.assert_called_once_with("check status")
+
+    executor.invoke({"intent": "provision_wallet", "args": {"chain": "solana"}})
+    mock_cirtus_agent.provision_wallet.assert_called_once_with("solana")
+
+
+def test_invoke_without_intent_returns_stub_response(mock_cirtus_agent):
+    """Prompts without a known intent fall through to the fixed stub response."""
+    executor = create_agent_executor(mock_cirtus_agent, "sk-testkey")
+
+    assert executor.invoke({"input": "What is my master agent?"}) == {"output": "stub-response"}
+    assert executor.invoke({"intent": "unknown_tool"}) == {"output": "stub-response"}
@@ -36,6 +36,12 @@ class TestTwoFactorSchemas:
         token = Token(**data)
         assert token.token_type == "bearer"  # Default value
 
+    def test_token_schema_refresh_token(self):
+        """Test Token schema keeps the refresh token when the server sends one."""
+        token = Token(access_token="a", refresh_token="r")
+        assert token.refresh_token == "r"
+        assert Token(access_token="a").refresh_token is None
+
     def test_token_schema_missing_access_token(self):
         """Test Token schema validation fails without access_token."""
         with pytest.raises(ValidationError) as exc_info:
@@ -81,6 +87,19 @@ class TestTwoFactorSchemas:
         assert len(setup.backup_codes) == 8
         assert all(isinstance(code, str) for code in setup.backup_codes)
 
+    def test_two_factor_setup_response_qr_code_png(self):
+        """Test the decoded QR code bytes are computed once and reused."""
+        data = {
+            "secret": "JBSWY3DPEHPK3PXP",
+            "qr_code_uri": "otpauth://totp/test",
+            "qr_code_image": "iVBORw0KGgo=",
+            "backup_codes": []
+        }
+        setup = TwoFactorSetupResponse(**data)
+        assert setup.qr_code_png == b"\x89PNG\r\n\x1a\n"
+        assert setup.qr_code_png is setup.qr_code_png
+        assert "qr_code_png" not in setup.model_dump()
+
     def test_two_factor_setup_response_empty_backup_codes(self):
         """Test TwoFactorSetupResponse with empty backup codes."""
         data = {
@@ -266,7 +285,8 @@ class TestSchemaModelDumps:
         dumped = token.model_dump()
         expected = {
             "access_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9...",
-            "token_type": "bearer"
+            "token_type": "bearer",
+            "refresh_token": None
         }
         assert dumped == expected
 